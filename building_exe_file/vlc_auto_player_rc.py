@@ -8,6 +8,8 @@ Requirements:
     - VLC Media Player installed
     - Python 3.6+
     - No additional packages required (uses only standard library)
+    - Optional: watchdog (pip install watchdog) for event-driven folder
+      monitoring; falls back to polling when it is not installed
 
 Usage:
     python vlc_auto_player_rc.py
@@ -21,10 +23,20 @@ import time
 import winreg
 import subprocess
 import socket
+import select
+import selectors
+import signal
+import threading
 import argparse
 from pathlib import Path
 from typing import Optional, List
-from datetime import datetime
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
 
 
 class VLCFinder:
@@ -89,7 +101,14 @@ class VLCFinder:
 class VLCRemoteControl:
     """Class to control VLC via RC interface."""
     
-    def __init__(self, host='localhost', port=9999, password='admin'):
+    # Fixed commands, encoded once
+    _CLEAR = b"clear\n"
+    _PLAY = b"play\n"
+    _STOP = b"stop\n"
+    _LOOP_ON = b"loop on\n"
+    _REPEAT_ON = b"repeat on\n"
+    
+    def __init__(self, host='127.0.0.1', port=9999, password='admin'):
         self.host = host
         self.port = port
         self.password = password
@@ -97,28 +116,45 @@ class VLCRemoteControl:
     
     def connect(self, max_retries=10, retry_delay=1) -> bool:
         """Connect to VLC RC interface."""
-        for attempt in range(max_retries):
+        # Bounded wait: retry quickly while VLC is still opening the port
+        deadline = time.monotonic() + max_retries * retry_delay
+        while self.socket is None and time.monotonic() < deadline:
             try:
-                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self.socket.settimeout(5)
-                self.socket.connect((self.host, self.port))
-                
-                # Read welcome message
-                welcome = self.socket.recv(1024).decode('utf-8', errors='ignore')
-                
-                # Send password if required
-                if 'Password' in welcome:
-                    self.send_command(self.password, wait_response=True)
-                
-                return True
+                self.socket = socket.create_connection((self.host, self.port), timeout=1.0)
+            except OSError:
+                # Refused or timed out (Windows takes ~2s to refuse a loopback
+                # connect) - VLC is still starting
+                time.sleep(0.05)
+        
+        if self.socket is None:
+            return False
+        
+        try:
+            self.socket.settimeout(2.0)
+            # Flush each small command immediately (no Nagle coalescing)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             
-            except (ConnectionRefusedError, socket.timeout, OSError) as e:
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                else:
-                    return False
+            # Read welcome banner until the prompt or password request
+            banner = b""
+            while b"> " not in banner and b"Password:" not in banner:
+                try:
+                    chunk = self.socket.recv(256)
+                except socket.timeout:
+                    break
+                if not chunk:
+                    break
+                banner += chunk
+            
+            # Send password if required
+            if b"Password:" in banner:
+                self.send_command(self.password, wait_response=True)
+            
+            return True
         
-        return False
+        except (socket.timeout, OSError):
+            self.close()
+            return False
     
     def send_command(self, command: str, wait_response=True) -> Optional[str]:
         """Send command to VLC and optionally wait for response."""
@@ -130,10 +166,11 @@ class VLCRemoteControl:
             self.socket.sendall(f"{command}\n".encode('utf-8'))
             
             if wait_response:
-                # Wait a bit for response
-                time.sleep(0.1)
-                response = self.socket.recv(4096).decode('utf-8', errors='ignore')
-                return response
+                # Return as soon as VLC replies (bounded wait)
+                readable, _, _ = select.select([self.socket], [], [], 0.5)
+                if readable:
+                    return self.socket.recv(4096).decode('utf-8', errors='ignore')
+                return ''
             
             return None
         
@@ -141,31 +178,41 @@ class VLCRemoteControl:
             print(f"Error sending command: {e}")
             return None
     
+    def send_raw(self, data: bytes):
+        """Send an already-encoded command line without waiting for a response."""
+        if not self.socket:
+            return
+        
+        try:
+            self.socket.sendall(data)
+        except Exception as e:
+            print(f"Error sending command: {e}")
+    
     def clear_playlist(self):
         """Clear the current playlist."""
-        self.send_command("clear", wait_response=False)
+        self.send_raw(self._CLEAR)
     
-    def add_to_playlist(self, video_path: str):
-        """Add video to playlist."""
+    def add_to_playlist(self, video_path: str, escaped: bool = False):
+        """Add video to playlist (pass escaped=True if the path already uses '/')."""
         # Escape path for VLC
-        escaped_path = str(video_path).replace('\\', '/')
+        escaped_path = video_path if escaped else str(video_path).replace('\\', '/')
         self.send_command(f'add "{escaped_path}"', wait_response=False)
     
     def play(self):
         """Start playback."""
-        self.send_command("play", wait_response=False)
+        self.send_raw(self._PLAY)
     
     def stop(self):
         """Stop playback."""
-        self.send_command("stop", wait_response=False)
+        self.send_raw(self._STOP)
     
     def loop_on(self):
         """Enable loop mode."""
-        self.send_command("loop on", wait_response=False)
+        self.send_raw(self._LOOP_ON)
     
     def repeat_on(self):
         """Enable repeat mode."""
-        self.send_command("repeat on", wait_response=False)
+        self.send_raw(self._REPEAT_ON)
     
     def close(self):
         """Close connection."""
@@ -177,14 +224,30 @@ class VLCRemoteControl:
             self.socket = None
 
 
+class FolderEventHandler(FileSystemEventHandler):
+    """Wake the monitor loop's selector on watchdog file events."""
+    
+    def __init__(self, notify_sock: socket.socket):
+        super().__init__()
+        self.notify_sock = notify_sock
+    
+    def on_any_event(self, event):
+        """Signal created/modified/deleted/moved file events."""
+        if not event.is_directory:
+            try:
+                self.notify_sock.send(b'\0')
+            except OSError:
+                pass  # Buffer full: a wakeup is already pending
+
+
 class VideoMonitor:
     """Class to monitor folder for videos and control VLC playback."""
     
     # Supported video file extensions
-    VIDEO_EXTENSIONS = {
+    VIDEO_EXTENSIONS = frozenset({
         '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm',
         '.m4v', '.mpg', '.mpeg', '.3gp', '.ogv', '.ts', '.vob'
-    }
+    })
     
     def __init__(self, vlc_path: str, folder_path: str, check_interval: int = 3):
         """
@@ -202,6 +265,8 @@ class VideoMonitor:
         self.vlc_process = None
         self.vlc_rc = None
         self.rc_port = 9999
+        self._video_count = 0  # Count from the most recent folder scan
+        self.observer = None
         
         if not self.folder_path.exists():
             raise ValueError(f"Folder does not exist: {folder_path}")
@@ -212,33 +277,28 @@ class VideoMonitor:
     def get_video_files(self) -> List[Path]:
         """Get all video files in the folder."""
         video_files = []
+        video_extensions = self.VIDEO_EXTENSIONS
         
         try:
-            for file in self.folder_path.iterdir():
-                if file.is_file() and file.suffix.lower() in self.VIDEO_EXTENSIONS:
-                    video_files.append(file)
+            with os.scandir(self.folder_path) as entries:
+                for entry in entries:
+                    # Plain string slice of the extension, no Path per entry
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot >= 0 and name[dot:].lower() in video_extensions and entry.is_file():
+                        video_files.append(Path(entry.path))
         except Exception as e:
             print(f"Error scanning folder: {e}")
         
+        self._video_count = len(video_files)
         return video_files
     
     def get_latest_video(self) -> Optional[Path]:
         """Get the most recently modified video file."""
         video_files = self.get_video_files()
         
-        if not video_files:
-            return None
-        
-        # Sort by modification time (newest first)
-        video_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        return video_files[0]
-    
-    def is_vlc_running(self) -> bool:
-        """Check if VLC process is still running."""
-        if self.vlc_process is None:
-            return False
-        
-        return self.vlc_process.poll() is None
+        # Single pass for the newest file (no full sort needed)
+        return max(video_files, key=lambda x: x.stat().st_mtime, default=None)
     
     def start_vlc_with_rc(self):
         """Start VLC with Remote Control interface enabled."""
@@ -249,7 +309,7 @@ class VideoMonitor:
             command = [
                 self.vlc_path,
                 '--intf', 'rc',  # Enable RC interface
-                '--rc-host', f'localhost:{self.rc_port}',  # RC interface host and port
+                '--rc-host', f'127.0.0.1:{self.rc_port}',  # RC interface on loopback only
                 '--rc-quiet',  # Quiet mode for RC
                 '--loop',  # Enable playlist looping
                 '--no-video-title-show',  # Don't show filename on video
@@ -258,20 +318,20 @@ class VideoMonitor:
             # Start VLC process
             self.vlc_process = subprocess.Popen(
                 command,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
             )
             
             print("✓ VLC started with RC interface")
             
-            # Give VLC a moment to start
-            time.sleep(2)
-            
             # Connect to RC interface
             print("Connecting to VLC Remote Control...")
             self.vlc_rc = VLCRemoteControl(port=self.rc_port)
             
-            if self.vlc_rc.connect():
+            # Probe the RC endpoint until VLC is ready instead of a fixed wait
+            if self.vlc_rc.connect(max_retries=100, retry_delay=0.1):
                 print("✓ Connected to VLC Remote Control interface")
                 
                 # Enable repeat mode for single video looping
@@ -294,11 +354,16 @@ class VideoMonitor:
             video_path: Path to the video file
         """
         try:
+            # One stat call and one path conversion per switch
+            st = video_path.stat()
+            video_path_str = str(video_path)
+            vlc_path_arg = video_path_str.replace('\\', '/')
+            
             print(f"\n{'=' * 80}")
             print(f"🎬 Switching to: {video_path.name}")
-            print(f"Location: {video_path}")
-            print(f"Size: {video_path.stat().st_size / (1024*1024):.2f} MB")
-            print(f"Modified: {datetime.fromtimestamp(video_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"Location: {video_path_str}")
+            print(f"Size: {st.st_size / (1024*1024):.2f} MB")
+            print(f"Modified: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(st.st_mtime))}")
             print(f"{'=' * 80}")
             
             # Clear current playlist
@@ -306,7 +371,7 @@ class VideoMonitor:
             time.sleep(0.3)
             
             # Add new video to playlist
-            self.vlc_rc.add_to_playlist(str(video_path))
+            self.vlc_rc.add_to_playlist(vlc_path_arg, escaped=True)
             time.sleep(0.3)
             
             # Start playback
@@ -322,6 +387,49 @@ class VideoMonitor:
         except Exception as e:
             print(f"✗ Error switching video: {e}")
     
+    def start_folder_watcher(self, notify_sock: socket.socket) -> bool:
+        """Start a watchdog observer on the folder (False if unavailable)."""
+        if Observer is None:
+            return False
+        
+        try:
+            self.observer = Observer()
+            self.observer.schedule(FolderEventHandler(notify_sock),
+                                   str(self.folder_path), recursive=False)
+            self.observer.start()
+            return True
+        except Exception as e:
+            print(f"⚠ Folder watcher unavailable, falling back to polling: {e}")
+            self.observer = None
+            return False
+    
+    def stop_folder_watcher(self):
+        """Stop the watchdog observer if it is running."""
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+    
+    def start_vlc_exit_watcher(self, notify_sock: socket.socket):
+        """Signal notify_sock from a helper thread when the VLC process exits."""
+        def wait_for_exit():
+            self.vlc_process.wait()
+            try:
+                notify_sock.send(b'\0')
+            except OSError:
+                pass
+        
+        threading.Thread(target=wait_for_exit, daemon=True).start()
+    
+    @staticmethod
+    def _drain(sock: socket.socket):
+        """Discard all pending wakeup bytes on a non-blocking socket."""
+        try:
+            while sock.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+    
     def monitor_and_play(self):
         """Main monitoring loop - continuously check for new videos and play them."""
         print("\n" + "=" * 80)
@@ -337,54 +445,91 @@ class VideoMonitor:
             print("\n❌ Failed to start VLC with Remote Control interface")
             return
         
-        # Initial check for videos
-        latest_video = self.get_latest_video()
+        status_interval = 30  # Seconds between status lines
         
-        if latest_video:
-            print(f"\nFound {len(self.get_video_files())} video(s) in folder")
-            self.switch_video(latest_video)
-        else:
-            print("\n⚠ No video files found in folder")
-            print("Waiting for videos to be added...")
+        # Wakeup sources for one blocking select(): folder events and VLC exit.
+        # Socket pairs rather than os.pipe, since Windows can only select sockets.
+        sel = selectors.DefaultSelector()
+        folder_r, folder_w = socket.socketpair()
+        exit_r, exit_w = socket.socketpair()
+        old_wakeup_fd = None
         
-        # Monitoring loop
+        # Everything after the socket pairs exist runs under the finally below,
+        # so a failure during setup still restores the wakeup fd and cleans up
         try:
-            last_status_time = time.time()
+            for sock in (folder_r, folder_w, exit_r, exit_w):
+                sock.setblocking(False)
+            sel.register(folder_r, selectors.EVENT_READ, 'folder')
+            sel.register(exit_r, selectors.EVENT_READ, 'vlc_exit')
+            self.start_vlc_exit_watcher(exit_w)
+            
+            # Let Ctrl+C wake select() (Windows does not interrupt it otherwise)
+            try:
+                old_wakeup_fd = signal.set_wakeup_fd(folder_w.fileno())
+            except ValueError:
+                old_wakeup_fd = None  # Not running in the main thread
+            
+            # Watch the folder before the initial scan so no new file is missed
+            if self.start_folder_watcher(folder_w):
+                print("✓ Watching folder for changes (watchdog)")
+                select_timeout = status_interval
+            else:
+                print(f"Polling folder every {self.check_interval} seconds")
+                select_timeout = self.check_interval
+            
+            # Initial check for videos
+            latest_video = self.get_latest_video()
+            
+            if latest_video:
+                print(f"\nFound {self._video_count} video(s) in folder")
+                self.switch_video(latest_video)
+            else:
+                print("\n⚠ No video files found in folder")
+                print("Waiting for videos to be added...")
+            
+            # Monitoring loop
+            last_status_time = time.monotonic()
             
             while True:
-                time.sleep(self.check_interval)
+                ready = {key.data for key, _ in sel.select(timeout=select_timeout)}
                 
                 # Check if VLC is still running
-                if not self.is_vlc_running():
+                if 'vlc_exit' in ready:
                     print("\n⚠ VLC was closed by user. Exiting monitor...")
                     break
                 
-                # Check for latest video
-                latest_video = self.get_latest_video()
+                # Rescan on folder events, or on every timeout when polling
+                folder_changed = 'folder' in ready or self.observer is None
+                if 'folder' in ready:
+                    # One file copy produces several events; drain them all
+                    self._drain(folder_r)
                 
-                if latest_video is None:
-                    # No videos in folder
-                    if self.current_video is not None:
-                        print("\n⚠ All videos removed from folder")
-                        self.vlc_rc.clear_playlist()
-                        self.current_video = None
-                    continue
-                
-                # Check if there's a new video (different from current)
-                if self.current_video is None or latest_video != self.current_video:
-                    print(f"\n{'*' * 80}")
-                    print("📹 NEW VIDEO DETECTED!")
-                    print(f"{'*' * 80}")
-                    self.switch_video(latest_video)
-                    last_status_time = time.time()  # Reset status timer after video change
+                if folder_changed:
+                    # Check for latest video
+                    latest_video = self.get_latest_video()
+                    
+                    if latest_video is None:
+                        # No videos in folder
+                        if self.current_video is not None:
+                            print("\n⚠ All videos removed from folder")
+                            self.vlc_rc.clear_playlist()
+                            self.current_video = None
+                        continue
+                    
+                    # Check if there's a new video (different from current)
+                    if self.current_video is None or latest_video != self.current_video:
+                        print(f"\n{'*' * 80}")
+                        print("📹 NEW VIDEO DETECTED!")
+                        print(f"{'*' * 80}")
+                        self.switch_video(latest_video)
+                        last_status_time = time.monotonic()  # Reset status timer after video change
                 
                 # Show status every 30 seconds
-                if time.time() - last_status_time >= 30:
-                    video_count = len(self.get_video_files())
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] "
+                if time.monotonic() - last_status_time >= status_interval:
+                    print(f"[{time.strftime('%H:%M:%S')}] "
                           f"Playing: {self.current_video.name if self.current_video else 'None'} | "
-                          f"Videos in folder: {video_count}")
-                    last_status_time = time.time()
+                          f"Videos in folder: {self._video_count}")
+                    last_status_time = time.monotonic()
         
         except KeyboardInterrupt:
             print("\n\n" + "=" * 80)
@@ -398,6 +543,14 @@ class VideoMonitor:
         
         finally:
             # Cleanup
+            self.stop_folder_watcher()
+            
+            if old_wakeup_fd is not None:
+                signal.set_wakeup_fd(old_wakeup_fd)
+            sel.close()
+            for sock in (folder_r, folder_w, exit_r, exit_w):
+                sock.close()
+            
             if self.vlc_rc:
                 self.vlc_rc.close()
             
@@ -4,20 +4,18 @@ from pathlib import Path
 
 def find_vlc():
     """Return full path to vlc.exe (Windows) or 'vlc' (others), or None if not found."""
-    candidates = []
-
     # 1) Optional env var
-    env = os.environ.get("VLC_PATH")
-    if env:
-        candidates.append(Path(env))
+    if (env := os.environ.get("VLC_PATH")) and Path(env).exists():
+        return str(Path(env))
 
     # 2) PATH
-    which = shutil.which("vlc.exe" if os.name == "nt" else "vlc")
-    if which:
-        candidates.append(Path(which))
+    if which := shutil.which("vlc.exe" if os.name == "nt" else "vlc"):
+        return str(Path(which))
 
     # 3) Windows Registry + common locations
     if os.name == "nt":
+        # Registry values and Program Files often repeat the same folder; stat each once
+        checked = set()
         try:
             import winreg
             # App Paths entry (best bet)
@@ -29,13 +27,15 @@ def find_vlc():
                             for valname in ("", "Path", "InstallDir"):
                                 try:
                                     val, _ = winreg.QueryValueEx(key, valname)
+                                    norm = os.path.normcase(os.path.normpath(val))
+                                    if norm in checked:
+                                        continue
+                                    checked.add(norm)
                                     p = Path(val)
                                     if p.is_file() and p.name.lower() == "vlc.exe":
-                                        candidates.append(p)
-                                    else:
-                                        vp = p / "vlc.exe"
-                                        if vp.exists():
-                                            candidates.append(vp)
+                                        return str(p)
+                                    if (vp := p / "vlc.exe").exists():
+                                        return str(vp)
                                 except FileNotFoundError:
                                     pass
                     except FileNotFoundError:
@@ -44,20 +44,21 @@ def find_vlc():
             pass
 
         # Common install dirs
-        for base in (Path(os.environ.get("ProgramFiles", r"C:\Program Files")),
-                     Path(os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)"))):
-            candidates.append(base / "VideoLAN" / "VLC" / "vlc.exe")
+        for base in dict.fromkeys((os.environ.get("ProgramFiles", r"C:\Program Files"),
+                                   os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)"))):
+            vlc_dir = os.path.join(base, "VideoLAN", "VLC")
+            if os.path.normcase(os.path.normpath(vlc_dir)) in checked:
+                continue
+            if (vp := Path(vlc_dir) / "vlc.exe").exists():
+                return str(vp)
     else:
         # Typical Unix locations (in case you reuse on Linux/macOS)
-        candidates += [Path("/usr/bin/vlc"), Path("/usr/local/bin/vlc")]
-
-    # Return the first existing path
-    for p in candidates:
-        if p and Path(p).exists():
-            return str(Path(p))
+        for p in ("/usr/bin/vlc", "/usr/local/bin/vlc"):
+            if Path(p).exists():
+                return p
     return None
 
-VIDEO_EXTS = {'.mp4','.mkv','.avi','.mov','.m4v','.webm','.ts','.mpeg','.mpg','.wmv'}
+VIDEO_EXTS = frozenset({'.mp4','.mkv','.avi','.mov','.m4v','.webm','.ts','.mpeg','.mpg','.wmv'})
 
 def pick_video(folder: Path, filename: str | None, index: int | None):
     folder = folder.expanduser().resolve()
@@ -74,7 +75,9 @@ def pick_video(folder: Path, filename: str | None, index: int | None):
             return str(matches[0])
         raise FileNotFoundError(f"'{filename}' not found in {folder}")
 
-    files = sorted([f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in VIDEO_EXTS])
+    with os.scandir(folder) as it:
+        files = sorted(Path(e.path) for e in it
+                       if os.path.splitext(e.name)[1].lower() in VIDEO_EXTS and e.is_file())
     if not files:
         raise FileNotFoundError(f"No video files found in {folder}")
 
@@ -10,6 +10,7 @@ Features:
 - Tests single video looping
 - Tests multiple video looping
 - Lots of print statements to understand the process
+  (per-item details with --verbose)
 
 Requirements:
     - Windows OS
@@ -18,48 +19,110 @@ Requirements:
 
 Usage:
     python vlc_playlist_tester.py --folder "C:\Videos"
+    python vlc_playlist_tester.py --folder "C:\Videos" --verbose
 """
 
 import os
 import sys
-import time
+import json
+import logging
 import subprocess
 import argparse
+import traceback
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 
+if sys.platform == 'win32':
+    import winreg
+else:
+    winreg = None
+
+log = logging.getLogger(__name__)
+
 # Supported video formats
 VIDEO_EXTENSIONS = {
     '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm',
     '.m4v', '.mpg', '.mpeg', '.3gp', '.ogv', '.ts', '.vob'
 }
+# Same extensions as a tuple for a single str.endswith() check
+VIDEO_EXT_TUPLE = tuple(VIDEO_EXTENSIONS)
+
+# Common VLC install locations, built once; the env-based entries usually
+# repeat the hard-coded ones, so duplicates are dropped (order preserved)
+_COMMON_VLC_PATHS = tuple(dict.fromkeys([
+    Path(r"C:\Program Files\VideoLAN\VLC\vlc.exe"),
+    Path(r"C:\Program Files (x86)\VideoLAN\VLC\vlc.exe"),
+    Path(os.environ.get('ProgramFiles', r"C:\Program Files")) / 'VideoLAN' / 'VLC' / 'vlc.exe',
+    Path(os.environ.get('ProgramFiles(x86)', r"C:\Program Files (x86)")) / 'VideoLAN' / 'VLC' / 'vlc.exe',
+]))
 
 
 class VLCFinder:
     """Find VLC Media Player on Windows"""
     
+    # Remembers the last found vlc.exe so later runs skip the search
+    CACHE_FILE = Path(os.environ.get('LOCALAPPDATA', Path.home())) / 'vlc_tester' / 'vlc_path.json'
+    
     def __init__(self):
         self.vlc_path = None
     
+    def _load_cached_path(self) -> Optional[str]:
+        """Return the cached VLC path if it still exists with the same mtime"""
+        try:
+            cached = json.loads(self.CACHE_FILE.read_text(encoding='utf-8'))
+            path = cached['path']
+            if Path(path).stat().st_mtime == cached['mtime']:
+                return path
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_cached_path(self, path: str):
+        """Store the found VLC path and its mtime for the next run"""
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self.CACHE_FILE.write_text(
+                json.dumps({'path': path, 'mtime': Path(path).stat().st_mtime}),
+                encoding='utf-8'
+            )
+        except OSError as e:
+            print(f"   ⚠️  Could not save VLC path cache: {e}")
+    
     def check_common_paths(self) -> Optional[str]:
         """Check common VLC installation paths"""
         print("\n🔍 Checking common VLC installation paths...")
         
-        common_paths = [
-            r"C:\Program Files\VideoLAN\VLC\vlc.exe",
-            r"C:\Program Files (x86)\VideoLAN\VLC\vlc.exe",
-            os.path.join(os.environ.get('ProgramFiles', 'C:\\Program Files'), 
-                        'VideoLAN', 'VLC', 'vlc.exe'),
-            os.path.join(os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)'), 
-                        'VideoLAN', 'VLC', 'vlc.exe'),
-        ]
+        for i, path in enumerate(_COMMON_VLC_PATHS, 1):
+            log.debug("   [%d] Checking: %s", i, path)
+            # is_file() also rejects a directory that happens to be named vlc.exe
+            if path.is_file():
+                log.debug("   ✅ FOUND!")
+                return str(path)
+            log.debug("   ❌ Not here")
         
-        for i, path in enumerate(common_paths, 1):
-            print(f"   [{i}] Checking: {path}")
-            if os.path.exists(path):
-                print(f"   ✅ FOUND!")
-                return path
-            print(f"   ❌ Not here")
+        return None
+    
+    def _probe_one(self, i: int, hkey, path: str) -> Optional[str]:
+        """Check one registry key for VLC's InstallDir (runs in a worker thread)"""
+        try:
+            log.debug("   [%d] Checking registry: %s", i, path)
+            # Each worker opens and closes its own key handle
+            reg_key = winreg.OpenKey(hkey, path)
+            install_dir, _ = winreg.QueryValueEx(reg_key, "InstallDir")
+            winreg.CloseKey(reg_key)
+            
+            if install_dir:
+                vlc_exe = Path(install_dir) / "vlc.exe"
+                log.debug("       Found install dir: %s", install_dir)
+                if vlc_exe.is_file():
+                    log.debug("   ✅ FOUND: %s", vlc_exe)
+                    return str(vlc_exe)
+                log.debug("   ❌ vlc.exe not in install dir")
+        except FileNotFoundError:
+            log.debug("   ❌ Registry key not found: %s", path)
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
         
         return None
     
@@ -67,35 +130,30 @@ class VLCFinder:
         """Scan Windows Registry for VLC"""
         print("\n🔍 Scanning Windows Registry...")
         
+        if winreg is None:
+            print("   ❌ winreg module not available (not Windows?)")
+            return None
+        
         try:
-            import winreg
-            
             registry_paths = [
                 (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\VideoLAN\VLC"),
                 (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\VideoLAN\VLC"),
             ]
             
-            for i, (hkey, path) in enumerate(registry_paths, 1):
-                try:
-                    print(f"   [{i}] Checking registry: {path}")
-                    reg_key = winreg.OpenKey(hkey, path)
-                    install_dir, _ = winreg.QueryValueEx(reg_key, "InstallDir")
-                    winreg.CloseKey(reg_key)
-                    
-                    if install_dir:
-                        vlc_exe = os.path.join(install_dir, "vlc.exe")
-                        print(f"       Found install dir: {install_dir}")
-                        if os.path.exists(vlc_exe):
-                            print(f"   ✅ FOUND: {vlc_exe}")
-                            return vlc_exe
-                        print(f"   ❌ vlc.exe not in install dir")
-                except FileNotFoundError:
-                    print(f"   ❌ Registry key not found")
-                except Exception as e:
-                    print(f"   ❌ Error: {e}")
+            # The keys are independent, so probe them concurrently, but take
+            # the results in registry_paths order so the native key wins
+            with ThreadPoolExecutor(max_workers=len(registry_paths)) as executor:
+                futures = [
+                    executor.submit(self._probe_one, i, hkey, path)
+                    for i, (hkey, path) in enumerate(registry_paths, 1)
+                ]
+                for future in futures:
+                    vlc_exe = future.result()
+                    if vlc_exe:
+                        for other in futures:
+                            other.cancel()
+                        return vlc_exe
             
-        except ImportError:
-            print("   ❌ winreg module not available (not Windows?)")
         except Exception as e:
             print(f"   ❌ Registry scan error: {e}")
         
@@ -107,10 +165,18 @@ class VLCFinder:
         print("🎯 SEARCHING FOR VLC MEDIA PLAYER")
         print("="*70)
         
+        # Cached result from a previous run (invalidated if vlc.exe changed)
+        vlc_path = self._load_cached_path()
+        if vlc_path:
+            print(f"\n✅ Using cached VLC path: {vlc_path}")
+            self.vlc_path = vlc_path
+            return vlc_path
+        
         # Method 1: Common paths
         vlc_path = self.check_common_paths()
         if vlc_path:
             self.vlc_path = vlc_path
+            self._save_cached_path(vlc_path)
             return vlc_path
         
         # Method 2: Registry
@@ -118,6 +184,7 @@ class VLCFinder:
             vlc_path = self.scan_registry_for_vlc()
             if vlc_path:
                 self.vlc_path = vlc_path
+                self._save_cached_path(vlc_path)
                 return vlc_path
         
         print("\n❌ VLC Media Player not found!")
@@ -135,57 +202,72 @@ class PlaylistTester:
         
         print(f"\n📁 Test folder will be: {self.test_folder}")
         
-    def get_video_files(self) -> List[Path]:
-        """Find all video files in folder"""
+        # Create test folder once for all playlist tests
+        self.test_folder.mkdir(parents=True, exist_ok=True)
+        print(f"✅ Test folder created: {self.test_folder}")
+        
+    def get_video_files(self) -> List[str]:
+        """Find all video files in folder (returned as path strings)"""
         print(f"\n🔍 Scanning folder for videos: {self.folder_path}")
         
         videos = []
         try:
-            for file in self.folder_path.iterdir():
-                if file.is_file() and file.suffix.lower() in VIDEO_EXTENSIONS:
-                    videos.append(file)
-                    print(f"   ✅ Found: {file.name}")
+            # DirEntry reuses the type info from the directory read (no extra stat)
+            with os.scandir(self.folder_path) as entries:
+                for entry in entries:
+                    # Cheap name check first; only video names pay for is_file()
+                    if not entry.name.lower().endswith(VIDEO_EXT_TUPLE):
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    videos.append(entry.path)
+                    log.debug("   ✅ Found: %s", entry.name)
         except Exception as e:
             print(f"   ❌ Error scanning folder: {e}")
         
         print(f"\n📊 Total videos found: {len(videos)}")
         return videos
     
-    def create_single_video_playlist(self, video_path: Path) -> Optional[Path]:
+    @staticmethod
+    def _write_playlist(playlist_path: Path, content: str):
+        """Write playlist text, skipping the UTF-8 codec for pure-ASCII content"""
+        # Same line endings text mode would write (CRLF on Windows)
+        content = content.replace("\n", os.linesep)
+        try:
+            data = content.encode("ascii")
+        except UnicodeEncodeError:
+            data = content.encode("utf-8")
+        playlist_path.write_bytes(data)
+    
+    def create_single_video_playlist(self, video_path: str) -> Optional[Path]:
         """Create playlist with ONE video for infinite looping"""
         print("\n" + "="*70)
         print("📝 CREATING SINGLE VIDEO PLAYLIST")
         print("="*70)
         
         try:
-            # Create test folder
-            self.test_folder.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Test folder created: {self.test_folder}")
-            
             # Playlist file path
             playlist_path = self.test_folder / "single_video_loop.m3u8"
             print(f"📄 Playlist file: {playlist_path}")
             
             print("\n📝 Writing playlist content...")
             print("   Line 1: #EXTM3U (Header)")
-            print(f"   Line 2: #EXTINF:-1,{video_path.name} (Metadata)")
+            video_name = os.path.basename(video_path)
+            print(f"   Line 2: #EXTINF:-1,{video_name} (Metadata)")
             print(f"   Line 3: {video_path} (Video path)")
             
-            # Write playlist
-            with open(playlist_path, 'w', encoding='utf-8') as f:
-                f.write("#EXTM3U\n")
-                f.write(f"#EXTINF:-1,{video_path.name}\n")
-                f.write(f"{video_path}\n")
+            # Write playlist in one call
+            lines = ["#EXTM3U\n", f"#EXTINF:-1,{video_name}\n{video_path}\n"]
+            content = "".join(lines)
+            self._write_playlist(playlist_path, content)
             
             print(f"\n✅ Playlist created successfully!")
             
-            # Show file contents
+            # Show file contents (already in memory, no need to read the file back)
             print("\n" + "-"*70)
             print("📄 PLAYLIST FILE CONTENTS:")
             print("-"*70)
-            with open(playlist_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                print(content)
+            print(content)
             print("-"*70)
             
             return playlist_path
@@ -194,41 +276,35 @@ class PlaylistTester:
             print(f"\n❌ Error creating playlist: {e}")
             return None
     
-    def create_multiple_video_playlist(self, video_paths: List[Path]) -> Optional[Path]:
+    def create_multiple_video_playlist(self, video_paths: List[str]) -> Optional[Path]:
         """Create playlist with MULTIPLE videos"""
         print("\n" + "="*70)
         print("📝 CREATING MULTIPLE VIDEO PLAYLIST")
         print("="*70)
         
         try:
-            # Create test folder
-            self.test_folder.mkdir(parents=True, exist_ok=True)
-            
             # Playlist file path
             playlist_path = self.test_folder / "multiple_video_loop.m3u8"
             print(f"📄 Playlist file: {playlist_path}")
             
             print(f"\n📝 Adding {len(video_paths)} videos to playlist...")
+            log.debug("   ✅ Header: #EXTM3U")
+            for i, video_path in enumerate(video_paths, 1):
+                log.debug("   [%d/%d] Adding: %s", i, len(video_paths), os.path.basename(video_path))
             
-            # Write playlist
-            with open(playlist_path, 'w', encoding='utf-8') as f:
-                f.write("#EXTM3U\n")
-                print("   ✅ Wrote header: #EXTM3U")
-                
-                for i, video_path in enumerate(video_paths, 1):
-                    print(f"   [{i}/{len(video_paths)}] Adding: {video_path.name}")
-                    f.write(f"#EXTINF:-1,{video_path.name}\n")
-                    f.write(f"{video_path}\n")
+            # Build the whole playlist, then write it in one call
+            lines = ["#EXTM3U\n"]
+            lines.extend(f"#EXTINF:-1,{os.path.basename(v)}\n{v}\n" for v in video_paths)
+            content = "".join(lines)
+            self._write_playlist(playlist_path, content)
             
             print(f"\n✅ Playlist with {len(video_paths)} videos created!")
             
-            # Show file contents
+            # Show file contents (already in memory, no need to read the file back)
             print("\n" + "-"*70)
             print("📄 PLAYLIST FILE CONTENTS:")
             print("-"*70)
-            with open(playlist_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                print(content)
+            print(content)
             print("-"*70)
             
             return playlist_path
@@ -270,14 +346,16 @@ class PlaylistTester:
             # Start VLC
             if sys.platform == 'win32':
                 startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags = subprocess.STARTF_USESHOWWINDOW
+                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
                 startupinfo.wShowWindow = 1  # SW_SHOWNORMAL
                 
+                # No console for VLC (it is a GUI app), so none is allocated
                 process = subprocess.Popen(
                     cmd,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
-                    startupinfo=startupinfo
+                    startupinfo=startupinfo,
+                    creationflags=subprocess.CREATE_NO_WINDOW
                 )
             else:
                 process = subprocess.Popen(
@@ -296,21 +374,20 @@ class PlaylistTester:
             print(f"\n⏱️  Video will play for 10 seconds (for testing)...")
             print(f"   Close VLC manually to test longer")
             
-            # Wait a bit
-            for i in range(10, 0, -1):
-                print(f"   ⏳ {i} seconds remaining...", end='\r')
-                time.sleep(1)
-            
-            print(f"\n\n🛑 Stopping VLC...")
-            process.terminate()
-            process.wait(timeout=3)
-            print(f"✅ VLC stopped")
+            # Wait up to 10 seconds, returning early if VLC is closed
+            try:
+                process.wait(timeout=10)
+                print(f"\n✅ VLC was closed before the 10 seconds were up")
+            except subprocess.TimeoutExpired:
+                print(f"\n🛑 Stopping VLC...")
+                process.terminate()
+                process.wait(timeout=3)
+                print(f"✅ VLC stopped")
             
             return True
             
         except Exception as e:
             print(f"\n❌ Error playing playlist: {e}")
-            import traceback
             traceback.print_exc()
             return False
     
@@ -379,6 +456,7 @@ def main():
 Examples:
   python vlc_playlist_tester.py --folder "C:\\Videos"
   python vlc_playlist_tester.py --folder "C:\\TVVideos"
+  python vlc_playlist_tester.py --folder "C:\\Videos" --verbose
 
 What this script does:
   1. Finds VLC on your system
@@ -392,9 +470,14 @@ What this script does:
     
     parser.add_argument('--folder', type=str, required=True,
                        help='Folder containing video files to test')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Show every path, registry key and file checked')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s')
+    
     # Find VLC
     finder = VLCFinder()
     vlc_path = finder.find_vlc()
@@ -412,13 +495,8 @@ What this script does:
     
     # Check folder
     folder_path = Path(args.folder)
-    if not folder_path.exists():
-        print(f"\n❌ Folder not found: {folder_path}")
-        input("\nPress Enter to exit...")
-        sys.exit(1)
-    
     if not folder_path.is_dir():
-        print(f"\n❌ Not a directory: {folder_path}")
+        print(f"\n❌ Folder not found or not a directory: {folder_path}")
         input("\nPress Enter to exit...")
         sys.exit(1)
     
@@ -430,7 +508,6 @@ What this script does:
         tester.run_tests()
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
     
     print("\n")
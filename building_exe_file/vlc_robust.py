@@ -15,17 +15,24 @@ Usage:
 
 import os
 import sys
+import stat
 import time
+import shutil
+import threading
 import winreg
 import subprocess
 import argparse
 import ctypes
+import json
+from ctypes import wintypes
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict
-from datetime import datetime
 
 # Windows API constants
 SW_SHOW = 5
+SW_SHOWMINIMIZED = 2
 SW_RESTORE = 9
 SW_SHOWNORMAL = 1
 HWND_TOP = 0
@@ -33,20 +40,151 @@ SWP_SHOWWINDOW = 0x0040
 SWP_NOSIZE = 0x0001
 SWP_NOMOVE = 0x0002
 
+# ReadDirectoryChangesW constants
+FILE_LIST_DIRECTORY = 0x0001
+FILE_SHARE_ALL = 0x0001 | 0x0002 | 0x0004  # READ | WRITE | DELETE
+OPEN_EXISTING = 3
+FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x0001
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x0010
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+WAIT_OBJECT_0 = 0
+
+# Registry constants
+ERROR_SUCCESS = 0
+ERROR_MORE_DATA = 234
+REG_SZ = 1
+REG_EXPAND_SZ = 2
+
+# EnumWindows callback prototype, built once rather than on every search
+_ENUM_WINDOWS_PROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, ctypes.py_object)
+
+
+class _WINDOWPLACEMENT(ctypes.Structure):
+    _fields_ = [
+        ('length', ctypes.c_uint),
+        ('flags', ctypes.c_uint),
+        ('showCmd', ctypes.c_uint),
+        ('ptMinPosition', ctypes.c_long * 2),
+        ('ptMaxPosition', ctypes.c_long * 2),
+        ('rcNormalPosition', ctypes.c_long * 4),
+    ]
+
+
+def _is_vlc_exe(path: str) -> bool:
+    """True if path is an existing regular file (one stat, no directories)."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+# All registry paths where programs are listed. "enum" keys hold one subkey
+# per installed program; "direct" keys are VLC's own InstallDir key.
+_REGISTRY_PATHS = (
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", "enum"),
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall", "enum"),
+    (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", "enum"),
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\VideoLAN\VLC", "direct"),
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\VideoLAN\VLC", "direct"),
+)
+
+
+def _vlc_from_icon(display_icon: str) -> Optional[str]:
+    """Extract the exe path from a DisplayIcon string like '"C:\\...\\vlc.exe",0'."""
+    icon_path = display_icon.split(",")[0].strip('"')
+    return icon_path if icon_path.lower().endswith("vlc.exe") else None
+
+
+# Uninstall-entry values that can locate vlc.exe, in the order they are tried
+_UNINSTALL_VALUE_EXTRACTORS = (
+    # Install location
+    ("InstallLocation", lambda value: os.path.join(value, "vlc.exe")),
+    # DisplayIcon (path is the part before the icon index)
+    ("DisplayIcon", _vlc_from_icon),
+    # UninstallString (often the uninstaller in the VLC directory)
+    ("UninstallString", lambda value: os.path.join(os.path.dirname(value.strip('"')), "vlc.exe")),
+)
+
+
+class _VALENTW(ctypes.Structure):
+    _fields_ = [
+        ('ve_valuename', wintypes.LPWSTR),
+        ('ve_valuelen', wintypes.DWORD),
+        ('ve_valueptr', ctypes.c_size_t),
+        ('ve_type', wintypes.DWORD),
+    ]
+
+
+_advapi32 = ctypes.windll.advapi32
+_advapi32.RegQueryMultipleValuesW.argtypes = [
+    wintypes.HKEY, ctypes.POINTER(_VALENTW), wintypes.DWORD,
+    wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD),
+]
+_advapi32.RegQueryMultipleValuesW.restype = wintypes.LONG
+
+
+def _query_multiple_values(key, names) -> Optional[List[Optional[str]]]:
+    """Read several string values in one RegQueryMultipleValuesW call.
+    
+    Returns None if the call fails, which includes any of the values
+    being missing, so callers can fall back to winreg.QueryValueEx.
+    """
+    entries = (_VALENTW * len(names))()
+    for entry, name in zip(entries, names):
+        entry.ve_valuename = name
+    
+    size = wintypes.DWORD(2048)
+    for _ in range(2):
+        buffer = ctypes.create_string_buffer(size.value)
+        status = _advapi32.RegQueryMultipleValuesW(
+            key.handle, entries, len(names),
+            ctypes.cast(buffer, wintypes.LPWSTR), ctypes.byref(size)
+        )
+        # size now holds the required length; retry once if it was too small
+        if status != ERROR_MORE_DATA:
+            break
+    if status != ERROR_SUCCESS:
+        return None
+    
+    values = []
+    for entry in entries:
+        if entry.ve_type in (REG_SZ, REG_EXPAND_SZ) and entry.ve_valuelen:
+            value = ctypes.wstring_at(entry.ve_valueptr, entry.ve_valuelen // 2).rstrip('\0')
+            values.append(value or None)
+        else:
+            values.append(None)
+    return values
+
 
 class RobustVLCFinder:
     """Comprehensive VLC finder using multiple methods including full registry scan."""
     
+    CACHE_FILE = Path(os.environ.get('LOCALAPPDATA') or Path.home()) / 'vlc_robust' / 'vlc_path.json'
+    
     def __init__(self):
         self.vlc_path = None
-        # All registry paths where programs are listed
-        self.registry_paths = [
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\VideoLAN\VLC"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\VideoLAN\VLC"),
-        ]
+    
+    def _load_cached_path(self) -> Optional[str]:
+        """Return the cached VLC path if vlc.exe is still there with the same mtime."""
+        try:
+            with open(self.CACHE_FILE, encoding='utf-8') as f:
+                cached = json.load(f)
+            path = cached['path']
+            if os.path.getmtime(path) == cached['mtime']:
+                return path
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_cached_path(self, path: str):
+        """Remember where VLC was found so the next start skips the search."""
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'path': path, 'mtime': os.path.getmtime(path)}, f)
+        except OSError as e:
+            print(f"  ⚠ Could not save VLC path cache: {e}")
     
     def get_registry_value(self, key, value_name: str) -> Optional[str]:
         """Safely get a registry value."""
@@ -58,74 +196,63 @@ class RobustVLCFinder:
         except Exception:
             return None
     
+    def _probe_uninstall_subkey(self, subkey) -> Optional[str]:
+        """Return vlc.exe from an uninstall entry if it belongs to VLC."""
+        display_name = self.get_registry_value(subkey, "DisplayName")
+        
+        # Check if this is VLC
+        if not display_name or "vlc" not in display_name.lower():
+            return None
+        
+        # Try to read all candidate values in one registry call. That fails
+        # if any value is absent, in which case read them one at a time so
+        # later ones are only queried when the earlier candidates miss.
+        names = [value_name for value_name, _ in _UNINSTALL_VALUE_EXTRACTORS]
+        values = _query_multiple_values(subkey, names)
+        if values is None:
+            values = (self.get_registry_value(subkey, value_name) for value_name in names)
+        
+        for (value_name, extractor), value in zip(_UNINSTALL_VALUE_EXTRACTORS, values):
+            if value:
+                vlc_exe = extractor(value)
+                if vlc_exe and _is_vlc_exe(vlc_exe):
+                    return vlc_exe
+        
+        return None
+    
     def scan_registry_for_vlc(self) -> Optional[str]:
         """Scan Windows Registry comprehensively for VLC installation."""
         print("  → Scanning Windows Registry for VLC...")
         
-        for hkey, path in self.registry_paths:
+        for hkey, path, kind in _REGISTRY_PATHS:
             try:
-                reg_key = winreg.OpenKey(hkey, path)
-                
-                # For direct VLC registry path
-                if "VideoLAN\\VLC" in path:
-                    install_dir = self.get_registry_value(reg_key, "InstallDir")
-                    reg_key.Close()
+                with winreg.OpenKey(hkey, path) as reg_key:
+                    # For direct VLC registry path
+                    if kind == "direct":
+                        install_dir = self.get_registry_value(reg_key, "InstallDir")
+                        if install_dir:
+                            vlc_exe = os.path.join(install_dir, "vlc.exe")
+                            if _is_vlc_exe(vlc_exe):
+                                return vlc_exe
+                        continue
                     
-                    if install_dir:
-                        vlc_exe = os.path.join(install_dir, "vlc.exe")
-                        if os.path.exists(vlc_exe):
-                            return vlc_exe
-                    continue
-                
-                # For uninstall registry paths, enumerate all programs
-                num_subkeys = winreg.QueryInfoKey(reg_key)[0]
-                
-                for i in range(num_subkeys):
-                    try:
-                        subkey_name = winreg.EnumKey(reg_key, i)
-                        subkey = winreg.OpenKey(reg_key, subkey_name)
-                        
-                        display_name = self.get_registry_value(subkey, "DisplayName")
+                    # For uninstall registry paths, enumerate all programs
+                    # until EnumKey runs out of subkeys
+                    i = 0
+                    while True:
+                        try:
+                            subkey_name = winreg.EnumKey(reg_key, i)
+                        except OSError:
+                            break
+                        i += 1
                         
-                        # Check if this is VLC
-                        if display_name and "vlc" in display_name.lower():
-                            # Try to get install location
-                            install_location = self.get_registry_value(subkey, "InstallLocation")
-                            
-                            if install_location:
-                                # Look for vlc.exe in install location
-                                vlc_exe = os.path.join(install_location, "vlc.exe")
-                                if os.path.exists(vlc_exe):
-                                    subkey.Close()
-                                    reg_key.Close()
-                                    return vlc_exe
-                            
-                            # Try DisplayIcon
-                            display_icon = self.get_registry_value(subkey, "DisplayIcon")
-                            if display_icon and "vlc.exe" in display_icon.lower():
-                                # Extract path from icon string
-                                icon_path = display_icon.split(",")[0].strip('"')
-                                if os.path.exists(icon_path) and icon_path.lower().endswith("vlc.exe"):
-                                    subkey.Close()
-                                    reg_key.Close()
-                                    return icon_path
-                            
-                            # Try UninstallString
-                            uninstall_string = self.get_registry_value(subkey, "UninstallString")
-                            if uninstall_string:
-                                # Often contains path to uninstaller in VLC directory
-                                uninstall_dir = os.path.dirname(uninstall_string.strip('"'))
-                                vlc_exe = os.path.join(uninstall_dir, "vlc.exe")
-                                if os.path.exists(vlc_exe):
-                                    subkey.Close()
-                                    reg_key.Close()
-                                    return vlc_exe
-                        
-                        subkey.Close()
-                    except OSError:
-                        continue
-                
-                reg_key.Close()
+                        try:
+                            with winreg.OpenKey(reg_key, subkey_name) as subkey:
+                                vlc_exe = self._probe_uninstall_subkey(subkey)
+                        except OSError:
+                            continue
+                        if vlc_exe:
+                            return vlc_exe
             
             except FileNotFoundError:
                 continue
@@ -148,7 +275,7 @@ class RobustVLCFinder:
         ]
         
         for path in common_paths:
-            if os.path.exists(path):
+            if _is_vlc_exe(path):
                 return path
         
         return None
@@ -157,12 +284,35 @@ class RobustVLCFinder:
         """Check if VLC is in system PATH."""
         print("  → Checking system PATH...")
         
-        path_dirs = os.environ.get('PATH', '').split(os.pathsep)
-        for path_dir in path_dirs:
-            vlc_exe = os.path.join(path_dir, 'vlc.exe')
-            if os.path.exists(vlc_exe):
-                return vlc_exe
+        # shutil.which also honours PATHEXT, so plain 'vlc' resolves too
+        return shutil.which('vlc.exe') or shutil.which('vlc')
+    
+    def _scan_for_vlc_exe(self, root: str, max_depth: Optional[int] = None,
+                          max_entries: int = 2000) -> Optional[str]:
+        """Breadth-first scandir search for vlc.exe under root, stopping at the first hit.
         
+        Only subdirectories with "vlc" or "videolan" in their name are entered,
+        and the search gives up after max_entries directory entries.
+        """
+        stack = deque([(root, 0)])
+        visited = 0
+        while stack:
+            path, depth = stack.popleft()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        visited += 1
+                        if visited > max_entries:
+                            return None
+                        name = entry.name.lower()
+                        if entry.is_dir(follow_symlinks=False):
+                            if ((max_depth is None or depth < max_depth)
+                                    and ('vlc' in name or 'videolan' in name)):
+                                stack.append((entry.path, depth + 1))
+                        elif name == 'vlc.exe' and entry.is_file():
+                            return entry.path
+            except OSError:
+                continue
         return None
     
     def search_program_files(self) -> Optional[str]:
@@ -175,74 +325,79 @@ class RobustVLCFinder:
         ]
         
         for search_dir in search_dirs:
-            if not os.path.exists(search_dir):
-                continue
+            # Look for VideoLAN folder
+            vlc_exe = self._scan_for_vlc_exe(os.path.join(search_dir, 'VideoLAN'))
+            if vlc_exe:
+                return vlc_exe
             
+            # Search more broadly (but limit depth)
             try:
-                # Look for VideoLAN folder
-                videolan_path = os.path.join(search_dir, 'VideoLAN')
-                if os.path.exists(videolan_path):
-                    for root, dirs, files in os.walk(videolan_path):
-                        if 'vlc.exe' in [f.lower() for f in files]:
-                            vlc_exe = os.path.join(root, 'vlc.exe')
-                            if os.path.exists(vlc_exe):
-                                return vlc_exe
-                
-                # Search more broadly (but limit depth)
-                for item in os.listdir(search_dir):
-                    if 'vlc' in item.lower():
-                        item_path = os.path.join(search_dir, item)
-                        if os.path.isdir(item_path):
-                            for root, dirs, files in os.walk(item_path):
-                                depth = root[len(item_path):].count(os.sep)
-                                if depth > 2:
-                                    continue
-                                if 'vlc.exe' in [f.lower() for f in files]:
-                                    vlc_exe = os.path.join(root, 'vlc.exe')
-                                    if os.path.exists(vlc_exe):
-                                        return vlc_exe
-            except (PermissionError, OSError):
+                with os.scandir(search_dir) as it:
+                    vlc_dirs = [entry.path for entry in it
+                                if 'vlc' in entry.name.lower() and entry.is_dir()]
+            except OSError:
                 continue
+            
+            for item_path in vlc_dirs:
+                vlc_exe = self._scan_for_vlc_exe(item_path, max_depth=2)
+                if vlc_exe:
+                    return vlc_exe
         
         return None
     
+    def _found(self, vlc_path: str, method_name: str) -> str:
+        """Report and remember a successful lookup."""
+        print(f"✓ Found VLC at: {vlc_path}")
+        print(f"  Method: {method_name}")
+        self.vlc_path = vlc_path
+        self._save_cached_path(vlc_path)
+        return vlc_path
+    
     def find_vlc(self) -> Optional[str]:
         """Find VLC using all available methods."""
         print("\n" + "=" * 80)
         print("SEARCHING FOR VLC MEDIA PLAYER")
         print("=" * 80)
         
-        # Method 1: Check common paths (fastest)
-        vlc_path = self.check_common_paths()
+        # Cached result from a previous run (validated by vlc.exe mtime)
+        vlc_path = self._load_cached_path()
         if vlc_path:
             print(f"✓ Found VLC at: {vlc_path}")
-            print(f"  Method: Common installation path")
+            print(f"  Method: Cached path")
             self.vlc_path = vlc_path
             return vlc_path
         
-        # Method 2: Scan Windows Registry (most reliable)
-        vlc_path = self.scan_registry_for_vlc()
+        # Method 1: Check common paths (fastest, no threads needed)
+        vlc_path = self.check_common_paths()
         if vlc_path:
-            print(f"✓ Found VLC at: {vlc_path}")
-            print(f"  Method: Windows Registry")
-            self.vlc_path = vlc_path
-            return vlc_path
+            return self._found(vlc_path, "Common installation path")
         
-        # Method 3: Check PATH environment
-        vlc_path = self.check_path_environment()
-        if vlc_path:
-            print(f"✓ Found VLC at: {vlc_path}")
-            print(f"  Method: System PATH")
-            self.vlc_path = vlc_path
-            return vlc_path
+        methods = [
+            # Method 2: Scan Windows Registry (most reliable)
+            ("Windows Registry", self.scan_registry_for_vlc),
+            # Method 3: Check PATH environment
+            ("System PATH", self.check_path_environment),
+            # Method 4: Search Program Files (thorough but slower)
+            ("Program Files search", self.search_program_files),
+        ]
         
-        # Method 4: Search Program Files (thorough but slower)
-        vlc_path = self.search_program_files()
-        if vlc_path:
-            print(f"✓ Found VLC at: {vlc_path}")
-            print(f"  Method: Program Files search")
-            self.vlc_path = vlc_path
-            return vlc_path
+        # The remaining methods are independent I/O, so run them together,
+        # but take the results in priority order: a registered install wins
+        # over a PATH or portable copy no matter which lookup finishes first
+        executor = ThreadPoolExecutor(max_workers=len(methods))
+        try:
+            futures = [(method_name, executor.submit(method)) for method_name, method in methods]
+            for method_name, future in futures:
+                try:
+                    vlc_path = future.result()
+                except Exception:
+                    continue
+                if vlc_path:
+                    for _, other in futures:
+                        other.cancel()
+                    return self._found(vlc_path, method_name)
+        finally:
+            executor.shutdown(wait=False)
         
         print("✗ VLC Media Player not found on this system")
         print("\nSearched locations:")
@@ -259,40 +414,65 @@ class WindowManager:
     def __init__(self):
         self.user32 = ctypes.windll.user32
         self.kernel32 = ctypes.windll.kernel32
+        
+        self.user32.EnumWindows.argtypes = [_ENUM_WINDOWS_PROC, ctypes.py_object]
+        self.user32.EnumWindows.restype = wintypes.BOOL
+        self.user32.IsWindowVisible.argtypes = [wintypes.HWND]
+        self.user32.IsWindowVisible.restype = wintypes.BOOL
+        self.user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        self.user32.GetWindowTextW.restype = ctypes.c_int
+        self.user32.GetForegroundWindow.argtypes = []
+        self.user32.GetForegroundWindow.restype = wintypes.HWND
+        
+        # One callback and one title buffer, reused by every EnumWindows pass
+        self._title_buf = ctypes.create_unicode_buffer(512)
+        self._enum_proc = _ENUM_WINDOWS_PROC(self._enum_windows_callback)
+        
+        # Reused by every get_window_placement() call
+        self._placement = _WINDOWPLACEMENT()
+        self._placement.length = ctypes.sizeof(_WINDOWPLACEMENT)
+    
+    def _enum_windows_callback(self, hwnd, state):
+        """EnumWindows callback; state is (lowercased partial title, results list)."""
+        if self.user32.IsWindowVisible(hwnd):
+            if self.user32.GetWindowTextW(hwnd, self._title_buf, len(self._title_buf)) > 0:
+                partial_title, results = state
+                title = self._title_buf.value
+                if partial_title in title.lower():
+                    results.append((hwnd, title))
+        return True
     
     def find_window_by_title_partial(self, partial_title: str) -> Optional[int]:
         """Find window handle by partial title match."""
-        def enum_windows_callback(hwnd, results):
-            if self.user32.IsWindowVisible(hwnd):
-                length = self.user32.GetWindowTextLengthW(hwnd)
-                if length > 0:
-                    buffer = ctypes.create_unicode_buffer(length + 1)
-                    self.user32.GetWindowTextW(hwnd, buffer, length + 1)
-                    title = buffer.value
-                    if partial_title.lower() in title.lower():
-                        results.append((hwnd, title))
-            return True
-        
         results = []
-        callback_type = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_int, ctypes.py_object)
-        callback = callback_type(enum_windows_callback)
-        self.user32.EnumWindows(callback, results)
+        self.user32.EnumWindows(self._enum_proc, (partial_title.lower(), results))
         
         return results[0][0] if results else None
     
     def find_vlc_window(self) -> Optional[int]:
         """Find VLC window handle."""
-        patterns = ["VLC media player", "vlc.exe", "VLC"]
+        # "vlc" is contained in every title pattern we accept, so one
+        # EnumWindows pass collects all candidates
+        results = []
+        self.user32.EnumWindows(self._enum_proc, ("vlc", results))
+        if not results:
+            return None
         
-        for pattern in patterns:
-            hwnd = self.find_window_by_title_partial(pattern)
-            if hwnd:
-                return hwnd
+        # Prefer the more specific titles, in the original pattern order
+        for pattern in ("vlc media player", "vlc.exe"):
+            for hwnd, title in results:
+                if pattern in title.lower():
+                    return hwnd
         
-        return None
+        return results[0][0]
     
     def bring_to_foreground(self, hwnd: int):
         """Bring window to foreground and make it visible."""
+        # Nothing to do if it is already the (non-minimized) foreground window
+        if (self.user32.GetForegroundWindow() == hwnd
+                and self.get_window_placement(hwnd) != SW_SHOWMINIMIZED):
+            return
+        
         self.user32.ShowWindow(hwnd, SW_RESTORE)
         self.user32.SetForegroundWindow(hwnd)
         self.user32.SetWindowPos(
@@ -304,30 +484,23 @@ class WindowManager:
     
     def get_window_placement(self, hwnd: int) -> int:
         """Get window show state."""
-        class WINDOWPLACEMENT(ctypes.Structure):
-            _fields_ = [
-                ('length', ctypes.c_uint),
-                ('flags', ctypes.c_uint),
-                ('showCmd', ctypes.c_uint),
-                ('ptMinPosition', ctypes.c_long * 2),
-                ('ptMaxPosition', ctypes.c_long * 2),
-                ('rcNormalPosition', ctypes.c_long * 4),
-            ]
-        
-        placement = WINDOWPLACEMENT()
-        placement.length = ctypes.sizeof(WINDOWPLACEMENT)
-        self.user32.GetWindowPlacement(hwnd, ctypes.byref(placement))
-        return placement.showCmd
+        self.user32.GetWindowPlacement(hwnd, ctypes.byref(self._placement))
+        return self._placement.showCmd
 
 
 class VideoMonitor:
     """Video monitor with robust VLC detection and window management."""
     
-    VIDEO_EXTENSIONS = {
+    VIDEO_EXTENSIONS = frozenset({
         '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm',
         '.m4v', '.mpg', '.mpeg', '.3gp', '.ogv', '.ts', '.vob',
         '.mp3', '.wav', '.flac', '.aac'  # Added audio formats
-    }
+    })
+    
+    # VLC exiting sooner than this after a launch counts as a failed start
+    MIN_RUN_SECONDS = 10
+    # Upper bound for the backoff between failed starts
+    MAX_RESTART_DELAY = 60
     
     def __init__(self, vlc_path: str, folder_path: str, check_interval: int = 60):
         self.vlc_path = vlc_path
@@ -335,36 +508,119 @@ class VideoMonitor:
         self.check_interval = check_interval
         self.current_video = None
         self.vlc_process = None
+        self.vlc_started = 0.0  # time.monotonic() of the last launch
+        self.restart_delay = 0
+        self.video_count = 0  # From the last get_latest_video() scan
         self.window_manager = WindowManager()
+        self.kernel32 = self.window_manager.kernel32
+        self.kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        self.kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        self.folder_changed = threading.Event()
+        self.watching_folder = False
         
         if not self.folder_path.exists():
             raise ValueError(f"Folder not found: {folder_path}")
         if not self.folder_path.is_dir():
             raise ValueError(f"Not a directory: {folder_path}")
     
-    def get_video_files(self) -> List[Path]:
-        """Get all video files in folder."""
-        videos = []
+    def _iter_video_entries(self):
+        """Yield os.DirEntry objects for the video files in the folder."""
+        with os.scandir(self.folder_path) as it:
+            for entry in it:
+                # Slice off just the extension instead of lowering the whole name
+                name = entry.name
+                dot = name.rfind('.')
+                if dot != -1 and name[dot:].lower() in self.VIDEO_EXTENSIONS and entry.is_file(follow_symlinks=False):
+                    yield entry
+    
+    def get_latest_video(self) -> Optional[Path]:
+        """Get newest video by modification time."""
+        latest = None
+        latest_mtime = None
+        count = 0
         try:
-            for file in self.folder_path.iterdir():
-                if file.is_file() and file.suffix.lower() in self.VIDEO_EXTENSIONS:
-                    videos.append(file)
+            # Single pass; DirEntry.stat() is cached from the directory read on Windows
+            for entry in self._iter_video_entries():
+                count += 1
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest, latest_mtime = entry, mtime
         except Exception as e:
             print(f"Error scanning folder: {e}")
-        return videos
+        self.video_count = count
+        return Path(latest.path) if latest else None
     
-    def get_latest_video(self) -> Optional[Path]:
-        """Get newest video by modification time."""
-        videos = self.get_video_files()
-        if not videos:
-            return None
-        videos.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        return videos[0]
+    def start_folder_watcher(self) -> bool:
+        """Watch the folder with ReadDirectoryChangesW; returns False if unavailable."""
+        kernel32 = self.window_manager.kernel32
+        kernel32.CreateFileW.argtypes = [
+            wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+            wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+        ]
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        kernel32.ReadDirectoryChangesW.argtypes = [
+            wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD, wintypes.BOOL,
+            wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID, wintypes.LPVOID,
+        ]
+        kernel32.ReadDirectoryChangesW.restype = wintypes.BOOL
+        
+        handle = kernel32.CreateFileW(
+            str(self.folder_path), FILE_LIST_DIRECTORY, FILE_SHARE_ALL, None,
+            OPEN_EXISTING, FILE_FLAG_BACKUP_SEMANTICS, None
+        )
+        if handle in (None, INVALID_HANDLE_VALUE):
+            return False
+        
+        threading.Thread(target=self._watch_folder, args=(handle,), daemon=True).start()
+        self.watching_folder = True
+        return True
+    
+    def _watch_folder(self, handle):
+        """Block on ReadDirectoryChangesW and flag every change to the main loop."""
+        kernel32 = self.window_manager.kernel32
+        buffer = ctypes.create_string_buffer(64 * 1024)
+        bytes_returned = wintypes.DWORD()
+        # The change records themselves are not needed, only the wake-up
+        while kernel32.ReadDirectoryChangesW(
+            handle, buffer, len(buffer), False,
+            FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_LAST_WRITE,
+            ctypes.byref(bytes_returned), None, None
+        ):
+            self.folder_changed.set()
+        
+        # Watching failed (e.g. folder removed); fall back to interval scans
+        self.watching_folder = False
+        kernel32.CloseHandle(handle)
     
     def is_vlc_running(self) -> bool:
         """Check if VLC is running."""
         return self.vlc_process and self.vlc_process.poll() is None
     
+    def wait_for_vlc_exit(self, timeout_ms: int) -> bool:
+        """Block up to timeout_ms on the VLC process handle; True if VLC exited."""
+        if not self.is_vlc_running():
+            time.sleep(timeout_ms / 1000)
+            return False
+        handle = int(self.vlc_process._handle)
+        # Wait in 500 ms slices: Ctrl+C is only handled between native calls
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return False
+            if self.kernel32.WaitForSingleObject(handle, min(remaining_ms, 500)) == WAIT_OBJECT_0:
+                return True
+    
+    def restart_vlc(self):
+        """Restart playback after VLC closed, backing off if it keeps exiting early."""
+        if time.monotonic() - self.vlc_started < self.MIN_RUN_SECONDS:
+            self.restart_delay = min(max(self.restart_delay * 2, 2), self.MAX_RESTART_DELAY)
+            print(f"⚠ VLC exited right after starting, retrying in {self.restart_delay}s...")
+            time.sleep(self.restart_delay)
+        else:
+            self.restart_delay = 0
+        self.play_video(self.current_video)
+    
     def stop_vlc(self):
         """Stop VLC if running."""
         if self.vlc_process and self.is_vlc_running():
@@ -403,8 +659,9 @@ class VideoMonitor:
             print(f"\n{'=' * 80}")
             print(f"▶️  Playing: {video_path.name}")
             print(f"   Location: {video_path}")
-            print(f"   Size: {video_path.stat().st_size / (1024*1024):.2f} MB")
-            print(f"   Modified: {datetime.fromtimestamp(video_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
+            video_stat = video_path.stat()
+            print(f"   Size: {video_stat.st_size / (1024*1024):.2f} MB")
+            print(f"   Modified: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(video_stat.st_mtime))}")
             print(f"{'=' * 80}\n")
             
             # Start VLC
@@ -426,6 +683,7 @@ class VideoMonitor:
                 stderr=subprocess.DEVNULL,
                 startupinfo=startupinfo
             )
+            self.vlc_started = time.monotonic()
             
             # Wait and ensure window is visible
             print("Starting VLC...")
@@ -449,8 +707,8 @@ class VideoMonitor:
             hwnd = self.window_manager.find_vlc_window()
             if hwnd:
                 placement = self.window_manager.get_window_placement(hwnd)
-                if placement == 2:  # Minimized
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] ⚠ VLC was minimized, restoring...")
+                if placement == SW_SHOWMINIMIZED:
+                    print(f"[{time.strftime('%H:%M:%S')}] ⚠ VLC was minimized, restoring...")
                     self.window_manager.bring_to_foreground(hwnd)
         except:
             pass
@@ -462,6 +720,10 @@ class VideoMonitor:
         print("=" * 80)
         print(f"Folder: {self.folder_path}")
         print(f"Check interval: {self.check_interval} seconds")
+        if self.start_folder_watcher():
+            print(f"New videos: Detected on folder change")
+        else:
+            print(f"New videos: Checked every {self.check_interval} seconds")
         print(f"Window monitor: Every 5 seconds")
         print(f"VLC will ALWAYS stay visible on screen")
         print(f"Press Ctrl+C to stop")
@@ -470,60 +732,78 @@ class VideoMonitor:
         # Start with latest video
         latest = self.get_latest_video()
         if latest:
-            print(f"\nFound {len(self.get_video_files())} video(s)")
+            print(f"\nFound {self.video_count} video(s)")
             self.play_video(latest)
         else:
             print("\n⚠ No videos found. Waiting...")
         
         # Monitor loop
         try:
-            last_status = time.time()
+            last_status = time.monotonic()
             check_counter = 0
             
             while True:
-                time.sleep(5)  # Check every 5 seconds
+                # Sleep on the VLC process handle: wakes after 5 seconds,
+                # or immediately if VLC exits
+                if self.wait_for_vlc_exit(5000) and self.current_video:
+                    print(f"\n⚠ VLC closed. Restarting playback...")
+                    self.restart_vlc()
+                    continue
                 check_counter += 1
                 
                 # Check window state every 5 seconds
                 self.check_and_restore_window()
                 
-                # Check for new videos at specified interval
-                if check_counter * 5 < self.check_interval:
+                # VLC is checked at the specified interval; the folder is only
+                # rescanned when the watcher saw a change (or at the interval
+                # if no watcher is running)
+                interval_due = check_counter * 5 >= self.check_interval
+                if self.watching_folder:
+                    rescan = self.folder_changed.is_set()
+                else:
+                    rescan = interval_due
+                
+                if not interval_due and not rescan:
                     continue
                 
-                check_counter = 0
+                if interval_due:
+                    check_counter = 0
                 
                 # Check if VLC closed
                 if self.current_video and not self.is_vlc_running():
                     print(f"\n⚠ VLC closed. Restarting playback...")
-                    self.play_video(self.current_video)
+                    self.restart_vlc()
                     continue
                 
-                # Check for new video
-                latest = self.get_latest_video()
-                
-                if not latest:
-                    if self.current_video:
-                        print("\n⚠ No videos in folder")
-                        self.stop_vlc()
-                        self.current_video = None
-                    continue
-                
-                # New video detected
-                if not self.current_video or latest != self.current_video:
-                    print(f"\n{'*' * 80}")
-                    print("🎬 NEW VIDEO DETECTED!")
-                    print(f"{'*' * 80}")
-                    self.play_video(latest)
-                    last_status = time.time()
+                if rescan:
+                    # Clear before scanning so a change during the scan re-arms it
+                    self.folder_changed.clear()
+                    
+                    # Check for new video
+                    latest = self.get_latest_video()
+                    
+                    if not latest:
+                        if self.current_video:
+                            print("\n⚠ No videos in folder")
+                            self.stop_vlc()
+                            self.current_video = None
+                        continue
+                    
+                    # New video detected
+                    if not self.current_video or latest != self.current_video:
+                        print(f"\n{'*' * 80}")
+                        print("🎬 NEW VIDEO DETECTED!")
+                        print(f"{'*' * 80}")
+                        self.play_video(latest)
+                        last_status = time.monotonic()
                 
                 # Status update
-                if time.time() - last_status >= 300:
-                    count = len(self.get_video_files())
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] "
+                if time.monotonic() - last_status >= 300:
+                    # The count is kept current by every rescan, so no extra listing here
+                    print(f"[{time.strftime('%H:%M:%S')}] "
                           f"Playing: '{self.current_video.name if self.current_video else 'None'}' | "
-                          f"Videos: {count}")
-                    last_status = time.time()
+                          f"Videos: {self.video_count}")
+                    last_status = time.monotonic()
         
         except KeyboardInterrupt:
             print("\n\n" + "=" * 80)
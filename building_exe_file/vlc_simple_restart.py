@@ -2,34 +2,85 @@
 VLC Auto Video Player - Simple Restart Method (Most Reliable)
 This is the simplest approach: restart VLC with the new video.
 While it briefly closes and reopens VLC, it's the most reliable method.
+When VLC is already running, new videos are first swapped in through its
+RC interface (a private port on 127.0.0.1); a restart is only the fallback.
 
 Requirements:
     - Windows OS
     - VLC Media Player installed
     - Python 3.6+
     - No additional packages required
+    - Optional: watchdog (pip install watchdog) to react to new videos as
+      soon as they appear; falls back to polling when it is not installed
 
 Usage:
     python vlc_simple_restart.py
     python vlc_simple_restart.py --folder "C:\Videos" --check-interval 60
+    python vlc_simple_restart.py --folder "Z:\Videos" --force-polling
 """
 
 import os
 import sys
 import time
+import queue
+import socket
 import winreg
 import subprocess
 import argparse
+from collections import namedtuple
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    PollingObserver = None
+    FileSystemEventHandler = object
+
+
+# A video file together with the stat fields taken during the folder scan
+VideoInfo = namedtuple('VideoInfo', ['path', 'mtime', 'size'])
+
 
 class VLCFinder:
     """Class to find VLC media player installation."""
     
+    CACHE_FILE = Path(os.environ.get('LOCALAPPDATA') or Path.home()) / 'vlc_autoplay' / 'vlc_path.txt'
+    
+    def load_cached_path(self) -> Optional[str]:
+        """Return the VLC path saved by a previous run, if it still exists."""
+        try:
+            path = self.CACHE_FILE.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        return path if path and os.path.exists(path) else None
+    
+    def save_cached_path(self, path: str):
+        """Save the VLC path so the next run can skip the search."""
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self.CACHE_FILE.write_text(path, encoding='utf-8')
+        except OSError as e:
+            print(f"⚠ Could not save VLC path cache: {e}")
+    
     def find_vlc(self) -> Optional[str]:
-        """Find VLC installation path."""
+        """Find VLC installation path, using the cached path when valid."""
+        vlc_path = self.load_cached_path()
+        if vlc_path:
+            print(f"✓ Using cached VLC path: {vlc_path}")
+            return vlc_path
+        
+        vlc_path = self.search_vlc()
+        if vlc_path:
+            self.save_cached_path(vlc_path)
+        return vlc_path
+    
+    def search_vlc(self) -> Optional[str]:
+        """Search common paths and the registry for VLC."""
         print("Searching for VLC Media Player...")
         print("-" * 80)
         
@@ -46,28 +97,70 @@ class VLCFinder:
                 print(f"✓ Found VLC at: {path}")
                 return path
         
-        # Check registry
-        registry_paths = [
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\VideoLAN\VLC"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\VideoLAN\VLC"),
-        ]
+        # Check registry: the 64-bit view, then the 32-bit view (what the
+        # WOW6432Node path points at). The view flags work the same from
+        # 32- and 64-bit Python and are ignored on 32-bit Windows.
+        registry_views = [winreg.KEY_WOW64_64KEY, winreg.KEY_WOW64_32KEY]
         
-        for hkey, reg_path in registry_paths:
+        for view in registry_views:
             try:
-                reg_key = winreg.OpenKey(hkey, reg_path)
-                install_dir, _ = winreg.QueryValueEx(reg_key, "InstallDir")
-                reg_key.Close()
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\VideoLAN\VLC",
+                                    0, winreg.KEY_READ | view) as reg_key:
+                    install_dir, _ = winreg.QueryValueEx(reg_key, "InstallDir")
                 vlc_exe = os.path.join(install_dir, "vlc.exe")
                 if os.path.exists(vlc_exe):
                     print(f"✓ Found VLC at: {vlc_exe}")
                     return vlc_exe
-            except:
+            except OSError:
                 continue
         
         print("✗ VLC not found")
         return None
 
 
+class NewVideoHandler(FileSystemEventHandler):
+    """Queue watchdog events for video files so the monitor loop can rescan.
+    
+    Items are (path, triggers) pairs. Modify events have triggers=False:
+    they never start a rescan themselves, they only show a file is still
+    being written so the monitor keeps waiting for it to settle.
+    """
+    
+    def __init__(self, events: queue.Queue, extensions):
+        super().__init__()
+        self.events = events
+        self.extensions = extensions
+    
+    def _enqueue(self, path: str, triggers: bool = True):
+        if path.lower().endswith(self.extensions):
+            self.events.put((path, triggers))
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+    
+    def on_moved(self, event):
+        # Either name may be a video: renamed in, or renamed away (e.g. to .bak)
+        if not event.is_directory:
+            if event.dest_path.lower().endswith(self.extensions):
+                self._enqueue(event.dest_path)
+            else:
+                self._enqueue(event.src_path)
+    
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path, triggers=False)
+    
+    def on_closed(self, event):
+        # Finished writing (inotify IN_CLOSE_WRITE; not reported on Windows)
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+
 class SimpleVideoMonitor:
     """Simple video monitor using VLC restart method."""
     
@@ -75,44 +168,223 @@ class SimpleVideoMonitor:
         '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm',
         '.m4v', '.mpg', '.mpeg', '.3gp', '.ogv', '.ts', '.vob'
     }
+    # Same extensions for a single str.endswith() call per file name
+    VIDEO_EXT_TUPLE = tuple(VIDEO_EXTENSIONS)
+    
+    # Quiet period after the last folder event before rescanning
+    DEBOUNCE_SECONDS = 1.5
     
-    def __init__(self, vlc_path: str, folder_path: str, check_interval: int = 60):
+    # Upper bound for the polling rescan interval while the folder is idle
+    MAX_POLL_INTERVAL = 300
+    
+    # VLC remote control interface used to switch videos without a restart;
+    # the port is picked per launch so no other VLC is ever reached
+    RC_HOST = '127.0.0.1'
+    
+    def __init__(self, vlc_path: str, folder_path: str, check_interval: int = 60,
+                 force_polling: bool = False):
         self.vlc_path = vlc_path
         self.folder_path = Path(folder_path)
         self.check_interval = check_interval
-        self.current_video = None
+        self.force_polling = force_polling
+        self.current_video = None  # VideoInfo of the video being played
         self.vlc_process = None
+        self.rc_sock = None
+        self.rc_port = None  # RC port of the VLC we started
+        self.video_mtimes: Dict[str, float] = {}  # Result of the last scan
+        self.observer = None
+        self.events = queue.Queue()
         
         if not self.folder_path.exists():
             raise ValueError(f"Folder not found: {folder_path}")
         if not self.folder_path.is_dir():
             raise ValueError(f"Not a directory: {folder_path}")
     
-    def get_video_files(self) -> List[Path]:
-        """Get all video files in folder."""
+    def scan_videos(self) -> List[VideoInfo]:
+        """Scan the folder once, stat-ing each video exactly once.
+        
+        Paths are kept as plain strings; callers build a Path only for the
+        entries they actually use.
+        """
         videos = []
         try:
-            for file in self.folder_path.iterdir():
-                if file.is_file() and file.suffix.lower() in self.VIDEO_EXTENSIONS:
-                    videos.append(file)
+            with os.scandir(self.folder_path) as it:
+                for entry in it:
+                    # The file type comes from the directory read, so only
+                    # the stat below costs a syscall
+                    if (entry.name.lower().endswith(self.VIDEO_EXT_TUPLE)
+                            and entry.is_file(follow_symlinks=False)):
+                        st = entry.stat(follow_symlinks=False)
+                        videos.append(VideoInfo(entry.path, st.st_mtime, st.st_size))
         except Exception as e:
             print(f"Error scanning folder: {e}")
+        self.video_mtimes = {video.path: video.mtime for video in videos}
         return videos
     
-    def get_latest_video(self) -> Optional[Path]:
+    def get_latest_video(self) -> Optional[VideoInfo]:
         """Get newest video by modification time."""
-        videos = self.get_video_files()
-        if not videos:
-            return None
-        videos.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        return videos[0]
+        # O(n) max over the cached mtimes instead of sorting the whole list
+        latest = max(self.scan_videos(), key=lambda video: video.mtime, default=None)
+        return latest._replace(path=Path(latest.path)) if latest else None
+    
+    def start_folder_watcher(self) -> bool:
+        """Start a watchdog observer on the folder (False if polling instead)."""
+        if self.force_polling or Observer is None:
+            return False
+        
+        handler = NewVideoHandler(self.events, self.VIDEO_EXT_TUPLE)
+        try:
+            self.observer = Observer()
+            self.observer.schedule(handler, str(self.folder_path), recursive=False)
+            self.observer.start()
+            return True
+        except Exception as e:
+            # Native notifications can fail on some network shares
+            print(f"⚠ Folder notifications unavailable ({e}), using watchdog polling")
+        
+        try:
+            self.observer = PollingObserver(timeout=self.check_interval)
+            self.observer.schedule(handler, str(self.folder_path), recursive=False)
+            self.observer.start()
+            return True
+        except Exception as e:
+            print(f"⚠ Folder watcher unavailable, falling back to polling: {e}")
+            self.observer = None
+            return False
+    
+    def stop_folder_watcher(self):
+        """Stop the watchdog observer if it is running."""
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+    
+    def next_event(self, timeout: float):
+        """Get the next folder event, raising queue.Empty after timeout.
+        
+        Waits in slices of at most 1 second: a lock wait with a timeout
+        cannot be interrupted by Ctrl+C on Windows.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            try:
+                return self.events.get(timeout=min(remaining, 1.0))
+            except queue.Empty:
+                if remaining <= 1.0:
+                    raise
+    
+    def wait_for_folder_change(self) -> bool:
+        """Wait up to check_interval for folder events; True once they settle."""
+        deadline = time.monotonic() + self.check_interval
+        while True:
+            try:
+                _, triggers = self.next_event(deadline - time.monotonic())
+            except queue.Empty:
+                return False
+            if triggers:
+                break
+        
+        # One copy produces a burst of events. Wait until the folder has been
+        # quiet for DEBOUNCE_SECONDS (but no longer than check_interval) so
+        # the folder is rescanned once; wait_until_settled() then makes sure
+        # the new file itself has stopped changing.
+        deadline = time.monotonic() + self.check_interval
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            try:
+                self.next_event(min(self.DEBOUNCE_SECONDS, remaining))
+            except queue.Empty:
+                return True
+    
+    def wait_until_settled(self, video: VideoInfo) -> Optional[VideoInfo]:
+        """Wait until the video's size and mtime hold across two checks.
+        
+        Events alone cannot tell a finished copy from a slow one, so a new
+        video is re-stat-ed every DEBOUNCE_SECONDS until it stops changing.
+        Returns the updated VideoInfo, or None if the file disappeared or is
+        still changing after check_interval; in the latter case the file is
+        queued for another look so a live recording cannot stall the loop.
+        """
+        previous = (video.size, video.mtime)
+        deadline = time.monotonic() + self.check_interval
+        while time.monotonic() < deadline:
+            time.sleep(self.DEBOUNCE_SECONDS)
+            try:
+                st = os.stat(video.path)
+            except OSError:
+                return None
+            current = (st.st_size, st.st_mtime)
+            if current == previous:
+                return video._replace(size=st.st_size, mtime=st.st_mtime)
+            previous = current
+        
+        print(f"⏳ {video.path.name} is still being written, checking again later")
+        self.events.put((str(video.path), True))
+        return None
     
     def is_vlc_running(self) -> bool:
         """Check if VLC is running."""
         return self.vlc_process and self.vlc_process.poll() is None
     
+    def close_rc(self):
+        """Close the RC connection if open."""
+        if self.rc_sock is not None:
+            try:
+                self.rc_sock.close()
+            except OSError:
+                pass
+            self.rc_sock = None
+    
+    def pick_rc_port(self) -> int:
+        """Ask the OS for a free loopback port for VLC's RC interface."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind((self.RC_HOST, 0))
+            return sock.getsockname()[1]
+    
+    def switch_via_rc(self, video: VideoInfo) -> bool:
+        """Swap the video in the running VLC over RC; False if that is not possible."""
+        if not self.is_vlc_running() or self.rc_port is None:
+            return False
+        
+        try:
+            if self.rc_sock is None:
+                self.rc_sock = socket.create_connection((self.RC_HOST, self.rc_port), timeout=2)
+            
+            # Discard any replies VLC sent so its output cannot fill the socket
+            self.rc_sock.setblocking(False)
+            try:
+                while self.rc_sock.recv(4096):
+                    pass
+            except (BlockingIOError, InterruptedError):
+                pass
+            self.rc_sock.settimeout(2)
+            
+            path = str(video.path).replace('\\', '/')
+            # is_playing always answers, so its 0/1 proves VLC got the commands;
+            # sendall alone can succeed on a connection VLC already closed
+            self.rc_sock.sendall(f'clear\nadd "{path}"\nloop on\nis_playing\n'.encode('utf-8'))
+            deadline = time.monotonic() + 2
+            reply = b''
+            while time.monotonic() < deadline:
+                chunk = self.rc_sock.recv(4096)
+                if not chunk:
+                    raise ConnectionResetError("VLC closed the RC connection")
+                reply += chunk
+                # The answer is a bare 0/1 line, possibly behind "> " prompts
+                for line in reply.split(b'\n')[:-1]:
+                    if line.strip().lstrip(b'> ') in (b'0', b'1'):
+                        return True
+            raise socket.timeout("no is_playing answer from VLC")
+        except OSError:
+            self.close_rc()
+            return False
+    
     def stop_vlc(self):
         """Stop VLC if running."""
+        self.close_rc()
         if self.vlc_process and self.is_vlc_running():
             try:
                 self.vlc_process.terminate()
@@ -125,29 +397,39 @@ class SimpleVideoMonitor:
                     pass
         self.vlc_process = None
     
-    def play_video(self, video_path: Path):
-        """Start VLC with video in loop mode."""
+    def play_video(self, video: VideoInfo):
+        """Play video in loop mode, switching in place or restarting VLC."""
         try:
+            print(f"\n{'=' * 80}")
+            print(f"▶️  Playing: {video.path.name}")
+            print(f"   Location: {video.path}")
+            print(f"   Size: {video.size / (1024*1024):.2f} MB")
+            print(f"   Modified: {datetime.fromtimestamp(video.mtime).strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"{'=' * 80}\n")
+            
+            # Fast path: swap the media in the running VLC
+            if self.switch_via_rc(video):
+                self.current_video = video
+                print("✓ Switched video in running VLC\n")
+                return
+            
             # Stop current VLC
             self.stop_vlc()
             
             # Brief pause for clean restart
             time.sleep(0.5)
             
-            print(f"\n{'=' * 80}")
-            print(f"▶️  Playing: {video_path.name}")
-            print(f"   Location: {video_path}")
-            print(f"   Size: {video_path.stat().st_size / (1024*1024):.2f} MB")
-            print(f"   Modified: {datetime.fromtimestamp(video_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"{'=' * 80}\n")
-            
-            # Start VLC with loop
+            # Start VLC with loop and the RC interface for later switches.
+            # No --play-and-exit: the RC "clear" would otherwise end VLC.
+            self.rc_port = self.pick_rc_port()
             command = [
                 self.vlc_path,
-                str(video_path),
+                str(video.path),
                 '--loop',  # Loop current video
                 '--no-video-title-show',  # Hide filename overlay
-                '--play-and-exit',  # Exit when done (combined with loop, keeps running)
+                '--extraintf', 'rc',  # Remote control alongside the normal UI
+                '--rc-host', f'{self.RC_HOST}:{self.rc_port}',
+                '--rc-quiet',  # No RC console window on Windows
             ]
             
             self.vlc_process = subprocess.Popen(
@@ -156,7 +438,7 @@ class SimpleVideoMonitor:
                 stderr=subprocess.DEVNULL
             )
             
-            self.current_video = video_path
+            self.current_video = video
             print("✓ Playback started\n")
             
         except Exception as e:
@@ -169,14 +451,21 @@ class SimpleVideoMonitor:
         print("=" * 80)
         print(f"Folder: {self.folder_path}")
         print(f"Check interval: {self.check_interval} seconds")
-        print(f"Method: Restart VLC for new videos (simple & reliable)")
+        print(f"Method: Switch via VLC RC, restart VLC as fallback")
         print(f"Press Ctrl+C to stop")
         print("=" * 80)
         
+        # Watch the folder before the initial scan so no new file is missed
+        watching = self.start_folder_watcher()
+        if watching:
+            print("✓ Watching folder for new videos (watchdog)")
+        else:
+            print(f"Polling folder every {self.check_interval} seconds")
+        
         # Start with latest video
         latest = self.get_latest_video()
         if latest:
-            print(f"\nFound {len(self.get_video_files())} video(s)")
+            print(f"\nFound {len(self.video_mtimes)} video(s)")
             self.play_video(latest)
         else:
             print("\n⚠ No videos found. Waiting...")
@@ -185,8 +474,20 @@ class SimpleVideoMonitor:
         try:
             last_status = time.time()
             
+            # Polling only: rescans back off exponentially while the folder
+            # is idle (VLC is still checked every check_interval)
+            idle_rounds = 0
+            last_mtimes = self.video_mtimes
+            next_scan = time.monotonic() + self.check_interval
+            
             while True:
-                time.sleep(self.check_interval)
+                if watching:
+                    # Wakes early on folder events; the timeout still
+                    # checks on VLC every check_interval
+                    folder_changed = self.wait_for_folder_change()
+                else:
+                    time.sleep(self.check_interval)
+                    folder_changed = time.monotonic() >= next_scan
                 
                 # Check if VLC closed
                 if self.current_video and not self.is_vlc_running():
@@ -194,29 +495,48 @@ class SimpleVideoMonitor:
                     self.play_video(self.current_video)
                     continue
                 
-                # Check for new video
-                latest = self.get_latest_video()
-                
-                if not latest:
-                    if self.current_video:
-                        print("\n⚠ No videos in folder")
-                        self.stop_vlc()
-                        self.current_video = None
-                    continue
-                
-                # New video detected
-                if not self.current_video or latest != self.current_video:
-                    print(f"\n{'*' * 80}")
-                    print("🎬 NEW VIDEO DETECTED!")
-                    print(f"{'*' * 80}")
-                    self.play_video(latest)
-                    last_status = time.time()
+                if folder_changed:
+                    # Check for new video
+                    latest = self.get_latest_video()
+                    
+                    if not watching:
+                        # Any change resets the interval to check_interval
+                        if self.video_mtimes == last_mtimes:
+                            idle_rounds = min(idle_rounds + 1, 16)
+                        else:
+                            idle_rounds = 0
+                        last_mtimes = self.video_mtimes
+                        interval = min(self.check_interval * 2 ** idle_rounds,
+                                       max(self.MAX_POLL_INTERVAL, self.check_interval))
+                        next_scan = time.monotonic() + interval
+                    
+                    if not latest:
+                        if self.current_video:
+                            print("\n⚠ No videos in folder")
+                            self.stop_vlc()
+                            self.current_video = None
+                        continue
+                    
+                    # New video detected
+                    if not self.current_video or latest.path != self.current_video.path:
+                        # Don't switch to a file that is still being copied
+                        latest = self.wait_until_settled(latest)
+                        if not latest:
+                            # Polling: look again on the next round
+                            next_scan = time.monotonic()
+                            continue
+                        print(f"\n{'*' * 80}")
+                        print("🎬 NEW VIDEO DETECTED!")
+                        print(f"{'*' * 80}")
+                        self.play_video(latest)
+                        last_status = time.time()
                 
                 # Status update every 5 minutes
                 if time.time() - last_status >= 300:
-                    count = len(self.get_video_files())
+                    # Counted from the last scan rather than listing the folder again
+                    count = len(self.video_mtimes)
                     print(f"[{datetime.now().strftime('%H:%M:%S')}] "
-                          f"Status: Playing '{self.current_video.name if self.current_video else 'None'}' | "
+                          f"Status: Playing '{self.current_video.path.name if self.current_video else 'None'}' | "
                           f"{count} video(s) in folder")
                     last_status = time.time()
         
@@ -231,6 +551,9 @@ class SimpleVideoMonitor:
             import traceback
             traceback.print_exc()
             self.stop_vlc()
+        
+        finally:
+            self.stop_folder_watcher()
 
 
 def main():
@@ -241,7 +564,8 @@ Examples:
   python vlc_simple_restart.py
   python vlc_simple_restart.py --folder "C:\\TVVideos" --check-interval 60
 
-Note: This version restarts VLC when switching videos. It's simple but reliable.
+Note: New videos are switched in the running VLC over its RC interface;
+      VLC is restarted only if that fails. Simple but reliable.
         """
     )
     
@@ -249,6 +573,9 @@ Note: This version restarts VLC when switching videos. It's simple but reliable.
                        help='Folder to monitor (default: current directory)')
     parser.add_argument('--check-interval', type=int, default=60,
                        help='Check interval in seconds (default: 60)')
+    parser.add_argument('--force-polling', action='store_true',
+                       help='Rescan the folder every check interval instead of using '
+                            'folder notifications (for SMB/CIFS shares)')
     
     args = parser.parse_args()
     
@@ -275,7 +602,8 @@ Note: This version restarts VLC when switching videos. It's simple but reliable.
     
     # Run monitor
     try:
-        monitor = SimpleVideoMonitor(vlc_path, folder, args.check_interval)
+        monitor = SimpleVideoMonitor(vlc_path, folder, args.check_interval,
+                                     args.force_polling)
         monitor.monitor_and_play()
     except ValueError as e:
         print(f"\n❌ Error: {e}")
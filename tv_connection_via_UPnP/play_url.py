@@ -1,15 +1,55 @@
 # pip install upnpclient lxml
+import argparse
+import json
+import os
+import socket
+import time
 import upnpclient
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 TV_IP = "192.168.0.135"              # your TV
 MEDIA_URL = "http://192.168.0.100:8000/Kicktracks.mp4"  # must be reachable by the TV over HTTP
                                          # (no file://, and not your localhost unless the TV can reach it)
+RENDERER_CACHE = os.path.join(os.path.expanduser("~"), ".vlc_autoplay", "renderer.json")
+
+# Minimal DIDL-Lite metadata (many LGs accept empty metadata too)
+# If you get format errors, try leaving CurrentURIMetaData="" entirely.
+DIDL_TEMPLATE = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<DIDL-Lite xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/"'
+    ' xmlns:dc="http://purl.org/dc/elements/1.1/"'
+    ' xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/">'
+    '<item id="0" parentID="0" restricted="1">'
+    '<dc:title>Ad Video</dc:title>'
+    '<upnp:class>object.item.videoItem</upnp:class>'
+    '<res protocolInfo="http-get:*:video/mp4:*">{url}</res>'
+    '</item>'
+    '</DIDL-Lite>'
+)
+
+SSDP_ADDR = ("239.255.255.250", 1900)
+M_SEARCH = (
+    "M-SEARCH * HTTP/1.1\r\n"
+    "HOST: 239.255.255.250:1900\r\n"
+    'MAN: "ssdp:discover"\r\n'
+    "MX: 1\r\n"
+    "ST: urn:schemas-upnp-org:device:MediaRenderer:1\r\n"
+    "\r\n"
+).encode("ascii")
+
+def build_didl(url):
+    return DIDL_TEMPLATE.format(url=url)
+
+DIDL = build_didl(MEDIA_URL)  # MEDIA_URL is constant, so build it once
+
+def is_tv_location(location):
+    # Exact host match: a prefix test would let 192.168.0.13 match 192.168.0.135
+    return urlparse(location).hostname == TV_IP
 
 def pick_renderer(devices):
     # Choose the LG MediaRenderer; prefer the exact IP or the device_type
     for d in devices:
-        if d.device_type.endswith("MediaRenderer:1") and d.location.startswith(f"http://{TV_IP}"):
+        if d.device_type.endswith("MediaRenderer:1") and is_tv_location(d.location):
             return d
     # fallback: any MediaRenderer
     for d in devices:
@@ -17,43 +57,103 @@ def pick_renderer(devices):
             return d
     return None
 
-def main():
-    devs = upnpclient.discover()
+def load_cached_renderer():
+    # Skip SSDP: fetch the device description straight from the last known location
+    try:
+        with open(RENDERER_CACHE, encoding="utf-8") as f:
+            cached = json.load(f)
+        location = cached.get("device_location", "")
+        if cached.get("tv_ip") == TV_IP and is_tv_location(location):
+            return upnpclient.Device(location)
+    except Exception:
+        pass  # no cache, or the TV moved / is off: fall back to discovery
+    return None
+
+def save_cached_renderer(d):
+    try:
+        os.makedirs(os.path.dirname(RENDERER_CACHE), exist_ok=True)
+        with open(RENDERER_CACHE, "w", encoding="utf-8") as f:
+            json.dump({"tv_ip": TV_IP, "device_location": d.location}, f)
+    except OSError as e:
+        print("Could not save renderer cache:", e)
+
+def ssdp_find_location(timeout=1.5):
+    # Targeted M-SEARCH: only the TV's LOCATION is used, so no other
+    # device on the LAN gets its description XML fetched
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    try:
+        sock.sendto(M_SEARCH, SSDP_ADDR)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            sock.settimeout(remaining)
+            data, (addr, _) = sock.recvfrom(65507)
+            if addr != TV_IP:
+                continue
+            for line in data.decode("utf-8", "replace").split("\r\n"):
+                name, _, value = line.partition(":")
+                value = value.strip()
+                if name.strip().lower() == "location" and is_tv_location(value):
+                    return value
+    except OSError:  # includes socket.timeout
+        return None
+    finally:
+        sock.close()
+
+def find_renderer():
+    d = load_cached_renderer()
+    if d:
+        return d
+
+    location = ssdp_find_location()
+    if location:
+        try:
+            d = upnpclient.Device(location)
+            save_cached_renderer(d)
+            return d
+        except Exception as e:
+            print("Could not load renderer description, doing full discovery:", e)
+
+    # Full discovery also allows the "any MediaRenderer" fallback in pick_renderer
+    devs = upnpclient.discover(timeout=1.5)
     if not devs:
         raise SystemExit("No UPnP devices found")
 
     d = pick_renderer(devs)
     if not d:
         raise SystemExit("No MediaRenderer found (LG TV not visible)")
+    # Only cache the TV itself, never the "any MediaRenderer" fallback
+    if is_tv_location(d.location):
+        save_cached_renderer(d)
+    return d
+
+def main():
+    parser = argparse.ArgumentParser(description="Play MEDIA_URL on the TV via UPnP/DLNA")
+    parser.add_argument("--debug", action="store_true",
+                        help="also query and print the TV's supported sink protocols")
+    args = parser.parse_args()
+
+    d = find_renderer()
+
+    # Grab the services, indexed by name ("urn:...:service:AVTransport:1" -> "AVTransport")
+    svc_map = {s.service_type.rsplit(":", 2)[-2]: s for s in d.services}
+    avt = svc_map["AVTransport"]
+    rc  = svc_map["RenderingControl"]
+    cm  = svc_map["ConnectionManager"]
 
-    # Grab the services
-    avt = next(s for s in d.services if s.service_type.endswith("AVTransport:1"))
-    rc  = next(s for s in d.services if s.service_type.endswith("RenderingControl:1"))
-    cm  = next(s for s in d.services if s.service_type.endswith("ConnectionManager:1"))
-
-    # Optional: inspect supported sink protocol infos
-    sink = cm.GetProtocolInfo()["Sink"]  # e.g. 'http-get:*:video/mp4:*;http-get:*:image/jpeg:*;...'
-    print("Supported SINK protocols:", sink)
-
-    # Minimal DIDL-Lite metadata (many LGs accept empty metadata too)
-    # If you get format errors, try leaving CurrentURIMetaData="" entirely.
-    didl = f"""<?xml version="1.0" encoding="utf-8"?>
-<DIDL-Lite xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/"
-           xmlns:dc="http://purl.org/dc/elements/1.1/"
-           xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/">
-  <item id="0" parentID="0" restricted="1">
-    <dc:title>Ad Video</dc:title>
-    <upnp:class>object.item.videoItem</upnp:class>
-    <res protocolInfo="http-get:*:video/mp4:*">{MEDIA_URL}</res>
-  </item>
-</DIDL-Lite>"""
+    # Optional: inspect supported sink protocol infos (extra SOAP round-trip, so --debug only)
+    if args.debug:
+        sink = cm.GetProtocolInfo()["Sink"]  # e.g. 'http-get:*:video/mp4:*;http-get:*:image/jpeg:*;...'
+        print("Supported SINK protocols:", sink)
 
     # 1) Tell the TV what to play
     # InstanceID is almost always 0 for single-zone renderers
     avt.SetAVTransportURI(
         InstanceID=0,
         CurrentURI=MEDIA_URL,
-        CurrentURIMetaData=didl  # try "" if TV complains
+        CurrentURIMetaData=DIDL  # try "" if TV complains
     )
 
     # 2) Start playback
@@ -57,60 +57,110 @@ def save_client_key(key):
         json.dump({"client-key": key}, f)
         print(f"Saved client-key to {CLIENT_KEY_FILE}")
 
-def try_connect(port):
-    print(f"Connecting to ws://{TV_IP}:{port} (subprotocol lgtv2)...")
+def try_connect(port, tv_ip=TV_IP):
+    print(f"Connecting to ws://{tv_ip}:{port} (subprotocol lgtv2)...")
     ws = websocket.create_connection(
-        f"ws://{TV_IP}:{port}",
+        f"ws://{tv_ip}:{port}",
         subprotocols=["lgtv2"],          # ← IMPORTANT!
         sslopt={"cert_reqs": ssl.CERT_NONE},
         timeout=5
     )
     return ws
 
+class WebOSClient:
+    """One websocket session to the TV, shared by pairing and later commands.
+
+        with WebOSClient(TV_IP) as tv:
+            tv.register()
+            tv.send_cmd("ssap://audio/setVolume", {"volume": 10})
+    """
+
+    def __init__(self, tv_ip=TV_IP, ports=PORTS):
+        self.tv_ip = tv_ip
+        self.ports = ports
+        self.ws = None
+        self._next_id = 0
+
+    def __enter__(self):
+        last_err = None
+        for port in self.ports:
+            try:
+                self.ws = try_connect(port, self.tv_ip)
+                return self
+            except Exception as e:
+                last_err = e
+                print(f"Failed on port {port}: {e}")
+                time.sleep(0.5)
+        raise ConnectionError(f"could not connect to {self.tv_ip}: {last_err}")
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.ws is not None:
+            self.ws.close()
+            self.ws = None
+        return False
+
+    def register(self):
+        """Pair with the TV (or re-use the saved key); returns the client-key.
+
+        Raises TimeoutError if the TV goes quiet without sending a client-key,
+        e.g. when nobody accepted the pairing prompt.
+        """
+        client_key = load_client_key()
+
+        payload = {
+            "type": "register",
+            "id": "register_0",
+            "payload": {
+                "forcePairing": False,
+                "pairingType": "PROMPT",
+                "manifest": manifest
+            }
+        }
+        # if we already paired once, include the key to skip prompt
+        if client_key:
+            payload["payload"]["client-key"] = client_key
+
+        self.ws.send(json.dumps(payload))
+        # TV should either pop up a pairing dialog or accept immediately;
+        # recv() returns as soon as a message arrives, so just stop once the
+        # TV has been quiet for 5 s
+        self.ws.settimeout(5)
+        while True:
+            try:
+                msg = self.ws.recv()
+            except websocket.WebSocketTimeoutException:
+                raise TimeoutError("pairing timed out: no client-key from the TV "
+                                   "(was the pairing prompt accepted?)") from None
+            print("TV:", msg)
+            data = json.loads(msg)
+            # when pairing accepted, TV returns client-key
+            if data.get("type") == "registered" and "client-key" in data.get("payload", {}):
+                ck = data["payload"]["client-key"]
+                print("✅ Paired! client-key =", ck)
+                save_client_key(ck)
+                return ck
+
+    def send_cmd(self, uri, payload=None):
+        """Send an ssap:// request on the open connection and return the TV's reply."""
+        self._next_id += 1
+        msg_id = f"req_{self._next_id}"
+        msg = {"type": "request", "id": msg_id, "uri": uri}
+        if payload is not None:
+            msg["payload"] = payload
+        self.ws.send(json.dumps(msg))
+        # skip unrelated messages (e.g. pairing prompts) until our reply arrives
+        while True:
+            data = json.loads(self.ws.recv())
+            if data.get("id") == msg_id:
+                return data
+
 def main():
-    last_err = None
-    for port in PORTS:
-        try:
-            ws = try_connect(port)
+    try:
+        with WebOSClient() as tv:
             print("Connected. Sending register…")
-            client_key = load_client_key()
-
-            payload = {
-                "type": "register",
-                "id": "register_0",
-                "payload": {
-                    "forcePairing": False,
-                    "pairingType": "PROMPT",
-                    "manifest": manifest
-                }
-            }
-            # if we already paired once, include the key to skip prompt
-            if client_key:
-                payload["payload"]["client-key"] = client_key
-
-            ws.send(json.dumps(payload))
-            # TV should either pop up a pairing dialog or accept immediately
-            for _ in range(5):
-                msg = ws.recv()
-                print("TV:", msg)
-                data = json.loads(msg)
-                # when pairing accepted, TV returns client-key
-                if data.get("type") == "registered" and "client-key" in data.get("payload", {}):
-                    ck = data["payload"]["client-key"]
-                    print("✅ Paired! client-key =", ck)
-                    save_client_key(ck)
-                    ws.close()
-                    return
-                time.sleep(0.2)
-
-            ws.close()
-            return
-        except Exception as e:
-            last_err = e
-            print(f"Failed on port {port}: {e}")
-            time.sleep(0.5)
-
-    print("❌ Could not establish a proper webOS session.", last_err)
+            tv.register()
+    except Exception as e:
+        print("❌ Could not establish a proper webOS session.", e)
 
 if __name__ == "__main__":
     main()